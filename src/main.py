@@ -37,11 +37,13 @@ por chamadas reais ao Vertex AI usando google-cloud-aiplatform.
 - Aula 03: Integração real com Vertex AI e output estruturado (JSON)
 """
 
+import functools
 import json
 import logging
+import re
 from pathlib import Path
-from typing import Dict, Any
-from jinja2 import Template, Environment, FileSystemLoader, TemplateNotFound
+from typing import Dict, Any, NamedTuple, Optional, Tuple
+from jinja2 import Template, Environment, FileSystemLoader, FileSystemBytecodeCache, TemplateNotFound
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
@@ -49,14 +51,65 @@ from rich.json import JSON
 
 from .router import ModelRouter
 from .telemetry import CostEstimator
-from .models import AuditResponse
+from .policy_loader import load_model_policy
+from .models import AuditResponse, AuditResponseDict
 from .exceptions import TemplateNotFoundError
 from .logger import setup_logging, get_logger
 
 # Configurar logging
 logger = get_logger(__name__)
 
+# Caminhos do projeto (estrutura ADK), resolvidos uma única vez na importação
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_POLICY_PATH = _PROJECT_ROOT / "config" / "model_policy.yaml"
 
+# Ambiente Jinja2 compartilhado (criado uma única vez na importação)
+# O Environment mantém os templates já compilados em cache: após o primeiro
+# uso, render_prompt_template apenas executa o template. auto_reload=False
+# dispensa a checagem de mtime do arquivo a cada get_template (templates
+# versionados em prompts/ não mudam com o processo em execução).
+# O bytecode_cache persiste o template compilado em disco (diretório
+# temporário do usuário): novos processos (CLI, cold start) carregam o
+# código já compilado em vez de refazer lex/parse/compile do .jinja2.
+# O cache é invalidado automaticamente quando o arquivo do template muda.
+_TEMPLATE_DIR = _PROJECT_ROOT / "prompts"
+
+
+def _make_bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """
+    Cria o cache de bytecode em disco dos templates (melhor esforço).
+    
+    FileSystemBytecodeCache cria o diretório temporário do usuário e falha
+    (RuntimeError/OSError) se ele tiver dono ou permissões inseguros. Como
+    isso roda na importação do módulo, a falha apenas desativa o cache em
+    disco: os templates continuam compilados em memória pelo Environment.
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except (RuntimeError, OSError) as e:
+        logger.warning(f"Cache de bytecode Jinja2 desativado: {e}")
+        return None
+
+
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(str(_TEMPLATE_DIR)),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+    cache_size=64,
+    bytecode_cache=_make_bytecode_cache()
+)
+
+# Palavras-chave da simulação do LLM (simulate_llm_response), pré-compiladas
+# como expressões regulares: cada categoria é verificada com uma única
+# varredura (em C) do texto, sem criar uma cópia em minúsculas.
+# 'transfer' também cobre 'transferência' (a busca é por substring).
+_REJECT_KEYWORDS = re.compile(r"exclusão|excluir|delete|remover|apagar", re.IGNORECASE)
+_REVIEW_KEYWORDS = re.compile(r"transfer|pix|pagamento", re.IGNORECASE)
+_APPROVE_KEYWORDS = re.compile(r"consulta|saldo|extrato", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=1024)
 def render_prompt_template(user_request: str, template_path: str = "prompts/audit_master.jinja2") -> str:
     """
     Carrega e processa o template Jinja2 do prompt de auditoria.
@@ -77,6 +130,9 @@ def render_prompt_template(user_request: str, template_path: str = "prompts/audi
     Usa Jinja2 para injetar variáveis dinamicamente no template.
     Isso permite versionamento de prompts e reutilização.
     
+    O resultado é memoizado por (user_request, template_path): o template é
+    fixo, então solicitações repetidas devolvem o prompt já renderizado.
+    
     Args:
         user_request: Solicitação do usuário a ser injetada no template
         template_path: Caminho relativo para o arquivo de template
@@ -88,24 +144,17 @@ def render_prompt_template(user_request: str, template_path: str = "prompts/audi
         FileNotFoundError: Se o template não for encontrado
         TemplateError: Se houver erro no processamento do template
     """
-    # Resolver caminho relativo à raiz do projeto
-    project_root = Path(__file__).parent.parent
-    template_dir = project_root / "prompts"
+    # Templates são resolvidos em prompts/ (raiz do projeto) pelo
+    # ambiente compartilhado _JINJA_ENV
+    template_dir = _TEMPLATE_DIR
     template_file = Path(template_path).name
     
     try:
-        logger.debug(f"Renderizando template: {template_file}")
-        # Configurar ambiente Jinja2 com FileSystemLoader
-        env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
-        
-        # Carregar e renderizar template
-        template = env.get_template(template_file)
+        logger.debug("Renderizando template: %s", template_file)
+        # Carregar (do cache de templates compilados) e renderizar
+        template = _JINJA_ENV.get_template(template_file)
         rendered = template.render(user_request=user_request)
-        logger.debug(f"Template renderizado com sucesso: {len(rendered)} caracteres")
+        logger.debug("Template renderizado com sucesso: %d caracteres", len(rendered))
         return rendered
     except TemplateNotFound as e:
         logger.error(f"Template não encontrado: {template_file}")
@@ -122,7 +171,62 @@ def render_prompt_template(user_request: str, template_path: str = "prompts/audi
         raise ValueError(f"Erro ao processar template Jinja2: {e}") from e
 
 
-def simulate_llm_response(model_name: str, user_request: str) -> Dict[str, Any]:
+# ----------------------------------------------------------------------------
+# Respostas Simuladas do LLM
+# ----------------------------------------------------------------------------
+# Veredito de cada categoria de palavras-chave: (compliance, risco, reasoning)
+_MOCK_VERDICTS = {
+    "reject": (
+        "REJECTED", "HIGH",
+        "Operação de exclusão de dados identificada. Rejeitada por violar políticas de retenção de dados."
+    ),
+    "review": (
+        "REQUIRES_REVIEW", "MEDIUM",
+        "Operação financeira detectada. Requer revisão adicional conforme política de compliance."
+    ),
+    "approve": (
+        "APPROVED", "LOW",
+        "Operação de consulta de baixo risco. Aprovada conforme políticas de acesso."
+    ),
+    "default": (
+        "APPROVED", "LOW",
+        "Solicitação genérica analisada. Sem riscos identificados."
+    ),
+}
+
+
+def _build_mock_response(compliance: str, risk: str, reasoning: str, detailed: bool) -> AuditResponseDict:
+    """
+    Monta uma resposta simulada já no formato de AuditResponse.
+    
+    Simula que o modelo Pro gera respostas mais detalhadas (mais tokens)
+    enquanto o Flash gera respostas mais concisas (menos tokens).
+    Isso afeta o cálculo de custos (mais tokens = maior custo).
+    """
+    if detailed:
+        # Resposta mais detalhada do Pro (simula análise mais profunda)
+        reasoning += " Análise detalhada realizada com modelo avançado."
+    else:
+        # Resposta mais concisa do Flash (simula otimização de custos)
+        reasoning = reasoning[:100] + "."
+    
+    return {
+        "compliance_status": compliance,
+        "risk_level": risk,
+        "audit_reasoning": reasoning
+    }
+
+
+# Como a simulação só depende da categoria e do modelo (Pro ou Flash), todas
+# as respostas possíveis são montadas uma única vez, na importação
+_MOCK_RESPONSES: Dict[Tuple[str, bool], AuditResponseDict] = {
+    (verdict, detailed): _build_mock_response(*fields, detailed)
+    for verdict, fields in _MOCK_VERDICTS.items()
+    for detailed in (True, False)
+}
+
+
+def simulate_llm_response(model_name: str, user_request: str) -> AuditResponseDict:
     """
     Simula a resposta do LLM sem fazer chamada real ao Vertex AI.
     
@@ -180,44 +284,70 @@ def simulate_llm_response(model_name: str, user_request: str) -> Dict[str, Any]:
     # ------------------------------------------------------------------------
     # Em produção, esta lógica seria substituída pela chamada real ao LLM
     # A simulação usa palavras-chave para determinar o nível de risco
-    request_lower = user_request.lower()
-    
     # Ordem importa: verificar exclusão antes de outras operações
-    if any(word in request_lower for word in ['exclusão', 'excluir', 'delete', 'remover', 'apagar']):
-        compliance = "REJECTED"
-        risk = "HIGH"
-        reasoning = "Operação de exclusão de dados identificada. Rejeitada por violar políticas de retenção de dados."
-    elif any(word in request_lower for word in ['transfer', 'transferência', 'pix', 'pagamento']):
-        compliance = "REQUIRES_REVIEW"
-        risk = "MEDIUM"
-        reasoning = "Operação financeira detectada. Requer revisão adicional conforme política de compliance."
-    elif any(word in request_lower for word in ['consulta', 'saldo', 'extrato']):
-        compliance = "APPROVED"
-        risk = "LOW"
-        reasoning = "Operação de consulta de baixo risco. Aprovada conforme políticas de acesso."
+    if _REJECT_KEYWORDS.search(user_request):
+        verdict = "reject"
+    elif _REVIEW_KEYWORDS.search(user_request):
+        verdict = "review"
+    elif _APPROVE_KEYWORDS.search(user_request):
+        verdict = "approve"
     else:
-        compliance = "APPROVED"
-        risk = "LOW"
-        reasoning = "Solicitação genérica analisada. Sem riscos identificados."
+        verdict = "default"
     
-    # ------------------------------------------------------------------------
-    # Simulação de Diferença entre Modelos
-    # ------------------------------------------------------------------------
-    # Simula que o modelo Pro gera respostas mais detalhadas (mais tokens)
-    # enquanto o Flash gera respostas mais concisas (menos tokens)
-    # Isso afeta o cálculo de custos (mais tokens = maior custo)
-    if 'pro' in model_name:
-        # Resposta mais detalhada do Pro (simula análise mais profunda)
-        reasoning += " Análise detalhada realizada com modelo avançado."
-    else:
-        # Resposta mais concisa do Flash (simula otimização de custos)
-        reasoning = reasoning[:100] + "."
+    # Resposta pré-montada (ver _MOCK_RESPONSES); a cópia protege a tabela
+    # contra alterações feitas pelo chamador
+    return _MOCK_RESPONSES[verdict, 'pro' in model_name].copy()
+
+
+@functools.lru_cache(maxsize=1)
+def _template_base_len() -> int:
+    """
+    Tamanho (em caracteres) da parte fixa do template de auditoria.
     
-    return {
-        "compliance_status": compliance,
-        "risk_level": risk,
-        "audit_reasoning": reasoning
-    }
+    O template injeta user_request uma única vez e sem escape, então o
+    prompt completo tem exatamente _template_base_len() + len(user_request)
+    caracteres. Calculado no primeiro uso (renderizando com solicitação
+    vazia), e não na importação, para que um template ausente não impeça
+    a importação do módulo.
+    """
+    return len(render_prompt_template(""))
+
+
+def _compact_json_chars(data: Any) -> int:
+    """
+    Tamanho (em caracteres) de um valor serializado como JSON compacto.
+    
+    Calculado percorrendo a estrutura, sem montar a string serializada:
+    strings somam as aspas, e dicionários/listas somam delimitadores,
+    dois-pontos e vírgulas (ex: um par "chave":"valor" soma
+    len(chave) + len(valor) + 5).
+    
+    ⚠️ Aproximação: caracteres que o JSON escaparia (aspas, barra invertida,
+    quebras de linha) são contados como 1 caractere. Para estimativa de
+    custos (FinOps) a diferença é irrelevante.
+    """
+    if isinstance(data, str):
+        return len(data) + 2
+    if isinstance(data, dict):
+        if not data:
+            return 2
+        # { } + vírgulas entre os n pares + "chave": de cada par
+        return 1 + len(data) + sum(
+            len(str(key)) + 3 + _compact_json_chars(value)
+            for key, value in data.items()
+        )
+    if isinstance(data, (list, tuple)):
+        if not data:
+            return 2
+        return 1 + len(data) + sum(_compact_json_chars(item) for item in data)
+    if data is None or data is True:
+        return 4
+    if data is False:
+        return 5
+    if type(data) is int:
+        return len(str(data))
+    # float e demais tipos: mesma representação usada pelo json
+    return len(json.dumps(data, ensure_ascii=False))
 
 
 def simulate_input_output(user_request: str, model_response: Dict[str, Any]) -> tuple[int, int]:
@@ -257,8 +387,9 @@ def simulate_input_output(user_request: str, model_response: Dict[str, Any]) ->
     # - Template do sistema (audit_master.jinja2) processado com Jinja2
     # - Solicitação do usuário injetada dinamicamente no template
     try:
-        full_prompt = render_prompt_template(user_request)
-        input_chars = len(full_prompt)
+        # O tamanho do prompt é aritmético: parte fixa do template +
+        # solicitação (sem renderizar o template a cada requisição)
+        input_chars = _template_base_len() + len(user_request)
     except Exception as e:
         # Fallback: se houver erro no template, usa aproximação
         input_chars = len(user_request) + 500  # Aproximação do template
@@ -268,12 +399,26 @@ def simulate_input_output(user_request: str, model_response: Dict[str, Any]) ->
     # ------------------------------------------------------------------------
     # Simula a resposta JSON que o modelo retornaria
     # Em produção, este seria o texto real retornado pela API
-    output_json = json.dumps(model_response, ensure_ascii=False, indent=2)
-    output_chars = len(output_json)
+    # Tamanho do JSON compacto, como a API retorna (a indentação só inflaria
+    # a contagem com espaços que não fazem parte da resposta real)
+    output_chars = _compact_json_chars(model_response)
     
     return input_chars, output_chars
 
 
+class Scenario(NamedTuple):
+    """
+    Cenário de teste da demonstração (uma requisição de um departamento).
+    
+    Tupla imutável com campos nomeados: o acesso aos campos é por posição
+    (scenario.department), sem busca por chave de dicionário.
+    """
+    department: str
+    department_name: str
+    user_request: str
+    complexity: float
+
+
 def main():
     """
     Função principal de demonstração.
@@ -308,12 +453,14 @@ def main():
     # ------------------------------------------------------------------------
     # Inicialização dos Componentes
     # ------------------------------------------------------------------------
-    # Router: Carrega política YAML e decide qual modelo usar
-    # CostEstimator: Carrega preços YAML e calcula custos
+    # Política: model_policy.yaml é lido e validado uma única vez
+    # Router: Usa a política para decidir qual modelo usar
+    # CostEstimator: Usa os preços da mesma política para calcular custos
     try:
         logger.info("Inicializando componentes: ModelRouter e CostEstimator")
-        router = ModelRouter()
-        cost_estimator = CostEstimator()
+        policy = load_model_policy(_POLICY_PATH)
+        router = ModelRouter(policy=policy)
+        cost_estimator = CostEstimator(policy=policy)
         logger.info("Componentes inicializados com sucesso")
     except Exception as e:
         logger.error(f"Erro ao inicializar componentes: {e}", exc_info=True)
@@ -326,103 +473,143 @@ def main():
     # Simula requisições de 3 departamentos diferentes para demonstrar
     # o roteamento baseado em tier e complexidade
     scenarios = [
-        {
-            "department": "legal_dept",
-            "department_name": "Departamento Jurídico",
-            "user_request": "Preciso revisar o contrato de parceria com a empresa XYZ para verificar cláusulas de confidencialidade",
-            "complexity": 0.8
-        },
-        {
-            "department": "hr_dept",
-            "department_name": "Recursos Humanos",
-            "user_request": "Verificar saldo de férias do funcionário ID 12345",
-            "complexity": 0.3
-        },
-        {
-            "department": "it_ops",
-            "department_name": "Operações de TI",
-            "user_request": "Consultar logs de acesso do sistema de gestão",
-            "complexity": 0.2
-        }
+        Scenario(
+            department="legal_dept",
+            department_name="Departamento Jurídico",
+            user_request="Preciso revisar o contrato de parceria com a empresa XYZ para verificar cláusulas de confidencialidade",
+            complexity=0.8
+        ),
+        Scenario(
+            department="hr_dept",
+            department_name="Recursos Humanos",
+            user_request="Verificar saldo de férias do funcionário ID 12345",
+            complexity=0.3
+        ),
+        Scenario(
+            department="it_ops",
+            department_name="Operações de TI",
+            user_request="Consultar logs de acesso do sistema de gestão",
+            complexity=0.2
+        )
     ]
     
     # ------------------------------------------------------------------------
-    # Processamento de Cada Cenário
+    # Processamento dos Cenários em Lote
+    # ------------------------------------------------------------------------
+    # Cada passo processa todos os cenários antes do próximo (em vez de
+    # cenário a cenário). Quando a simulação for trocada por chamadas reais
+    # ao Vertex AI (Aula 03), o Passo 2 pode disparar todas as chamadas em
+    # paralelo (ex: asyncio.gather) sem reestruturar o restante do fluxo.
+    
+    # ------------------------------------------------------------------------
+    # Passo 1: Roteamento (Decisão do Modelo)
     # ------------------------------------------------------------------------
+    # O router consulta a política YAML e decide qual modelo usar
+    # baseado no tier do departamento e na complexidade da requisição
+    routed = []
     for idx, scenario in enumerate(scenarios, 1):
-        console.print(f"\n[bold yellow]━━━ Cenário {idx}: {scenario['department_name']} ━━━[/bold yellow]\n")
-        
-        # --------------------------------------------------------------------
-        # Passo 1: Roteamento (Decisão do Modelo)
-        # --------------------------------------------------------------------
-        # O router consulta a política YAML e decide qual modelo usar
-        # baseado no tier do departamento e na complexidade da requisição
         try:
-            logger.info(f"Processando cenário {idx}: {scenario['department_name']}")
+            logger.info("Processando cenário %d: %s", idx, scenario.department_name)
             selected_model = router.route_request(
-                scenario['department'],
-                scenario['complexity']
+                scenario.department,
+                scenario.complexity
             )
-            logger.debug(f"Modelo selecionado: {selected_model}")
+            logger.debug("Modelo selecionado: %s", selected_model)
         except Exception as e:
-            logger.error(f"Erro no roteamento para {scenario['department']}: {e}", exc_info=True)
-            console.print(f"[bold red]Erro no roteamento: {e}[/bold red]")
+            logger.error(f"Erro no roteamento para {scenario.department}: {e}", exc_info=True)
+            console.print(f"[bold red]Erro no roteamento (Cenário {idx}): {e}[/bold red]")
+            continue
+        routed.append((idx, scenario, selected_model))
+    
+    # ------------------------------------------------------------------------
+    # Passo 2: Simulação de Chamadas ao LLM
+    # ------------------------------------------------------------------------
+    # Em produção, aqui seriam feitas as chamadas reais ao Vertex AI
+    # com o modelo selecionado e o prompt formatado
+    responses = [
+        simulate_llm_response(selected_model, scenario.user_request)
+        for _, scenario, selected_model in routed
+    ]
+    
+    # ------------------------------------------------------------------------
+    # Passo 3: Cálculo de Custos (FinOps)
+    # ------------------------------------------------------------------------
+    # Simula tamanho do input/output e calcula custo estimado
+    # Em produção, os tokens viriam da resposta da API do Vertex AI
+    sizes = [
+        simulate_input_output(scenario.user_request, response)
+        for (_, scenario, _), response in zip(routed, responses)
+    ]
+    
+    # Todos os custos em uma única chamada vetorizada (ver calculate_costs)
+    try:
+        costs = cost_estimator.calculate_costs_from_chars(
+            [selected_model for _, _, selected_model in routed],
+            [input_chars for input_chars, _ in sizes],
+            [output_chars for _, output_chars in sizes]
+        )
+    except Exception:
+        # Falha no lote: recalcula cenário a cenário, para que apenas o
+        # cenário com problema (ex: modelo sem preço) fique de fora
+        costs = []
+        for (idx, _, selected_model), (input_chars, output_chars) in zip(routed, sizes):
+            try:
+                costs.append(
+                    cost_estimator.calculate_cost(selected_model, input_chars, output_chars)
+                )
+            except Exception as e:
+                logger.error(f"Erro no cálculo de custo: {e}", exc_info=True)
+                console.print(f"[bold red]Erro no cálculo de custo (Cenário {idx}): {e}[/bold red]")
+                costs.append(None)
+    
+    # ------------------------------------------------------------------------
+    # Passo 4: Exibição de Resultados
+    # ------------------------------------------------------------------------
+    # Usa a biblioteca Rich para criar tabelas e painéis formatados.
+    # Uma única tabela comparativa (uma linha por cenário) é montada e
+    # renderizada uma vez, facilitando a comparação Flash vs Pro
+    table = Table(
+        show_header=True,
+        header_style="bold magenta",
+        caption="Input/Output em caracteres"
+    )
+    table.add_column("#", style="cyan", justify="right")
+    table.add_column("Departamento", style="white")
+    table.add_column("Complex.", justify="right")
+    table.add_column("Modelo Escolhido", style="bold green", no_wrap=True)
+    table.add_column("Custo (USD)", style="bold yellow", justify="right", no_wrap=True)
+    table.add_column("Input", justify="right")
+    table.add_column("Output", justify="right")
+    
+    audit_responses = []
+    for (idx, scenario, selected_model), mock_response, (input_chars, output_chars), estimated_cost in zip(
+        routed, responses, sizes, costs
+    ):
+        if estimated_cost is None:
             continue
         
-        # --------------------------------------------------------------------
-        # Passo 2: Simulação de Chamada ao LLM
-        # --------------------------------------------------------------------
-        # Em produção, aqui seria feita a chamada real ao Vertex AI
-        # com o modelo selecionado e o prompt formatado
-        mock_response = simulate_llm_response(
+        table.add_row(
+            str(idx),
+            scenario.department_name,
+            f"{scenario.complexity:.2f}",
             selected_model,
-            scenario['user_request']
+            f"${estimated_cost:.6f}",
+            str(input_chars),
+            str(output_chars)
         )
         
-        # --------------------------------------------------------------------
-        # Passo 3: Cálculo de Custos (FinOps)
-        # --------------------------------------------------------------------
-        # Simula tamanho do input/output e calcula custo estimado
-        # Em produção, os tokens viriam da resposta da API do Vertex AI
-        input_chars, output_chars = simulate_input_output(
-            scenario['user_request'],
-            mock_response
+        # Resposta do auditor em formato JSON formatado
+        # JSON.from_data serializa o dicionário uma única vez (JSON(texto)
+        # faria json.dumps aqui e, dentro do Rich, loads + dumps de novo)
+        audit_responses.append(
+            f"\n[bold]Resposta do Auditor - Cenário {idx} ({scenario.department_name}):[/bold]"
         )
-        
-        try:
-            estimated_cost = cost_estimator.calculate_cost(
-                selected_model,
-                input_chars,
-                output_chars
-            )
-            logger.debug(f"Custo estimado: ${estimated_cost:.6f} USD")
-        except Exception as e:
-            logger.error(f"Erro no cálculo de custo: {e}", exc_info=True)
-            console.print(f"[bold red]Erro no cálculo de custo: {e}[/bold red]")
-            continue
-        
-        # --------------------------------------------------------------------
-        # Passo 4: Exibição de Resultados
-        # --------------------------------------------------------------------
-        # Usa a biblioteca Rich para criar tabelas e painéis formatados
-        table = Table(show_header=True, header_style="bold magenta")
-        table.add_column("Atributo", style="cyan", width=25)
-        table.add_column("Valor", style="white")
-        
-        table.add_row("Departamento", scenario['department_name'])
-        table.add_row("Complexidade", f"{scenario['complexity']:.2f}")
-        table.add_row("Modelo Escolhido", f"[bold green]{selected_model}[/bold green]")
-        table.add_row("Custo Estimado", f"[bold yellow]${estimated_cost:.6f} USD[/bold yellow]")
-        table.add_row("Input (chars)", str(input_chars))
-        table.add_row("Output (chars)", str(output_chars))
-        
-        console.print(table)
-        
-        # Exibir resposta do auditor em formato JSON formatado
-        console.print("\n[bold]Resposta do Auditor:[/bold]")
-        console.print(JSON(json.dumps(mock_response, ensure_ascii=False, indent=2)))
-        
-        console.print("\n")
+        audit_responses.append(JSON.from_data(mock_response, ensure_ascii=False, indent=2))
+    
+    # Uma única chamada a console.print: tabela e respostas são medidas e
+    # renderizadas juntas, com uma escrita no terminal
+    console.print(table, *audit_responses, sep="\n")
+    console.print("\n")
     
     # ------------------------------------------------------------------------
     # Resumo Final
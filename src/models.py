@@ -3,8 +3,9 @@ Modelos Pydantic para Validação de Dados
 Valida estruturas YAML e respostas do LLM
 """
 
-from typing import Dict, Optional, Literal
-from pydantic import BaseModel, Field, field_validator
+from types import MappingProxyType
+from typing import Dict, Optional, Literal, TypedDict
+from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
 
 
 # ============================================================================
@@ -13,12 +14,18 @@ from pydantic import BaseModel, Field, field_validator
 
 class PricingModel(BaseModel):
     """Modelo de preços para um modelo LLM."""
+    # Imutável: as tabelas de preço do CostEstimator são pré-computadas
+    model_config = ConfigDict(frozen=True)
+    
     input_per_1k_tokens: float = Field(gt=0, description="Preço por 1k tokens de input")
     output_per_1k_tokens: float = Field(gt=0, description="Preço por 1k tokens de output")
 
 
 class DepartmentConfig(BaseModel):
     """Configuração de um departamento na política de roteamento."""
+    # Imutável: a tabela de roteamento do ModelRouter é pré-computada
+    model_config = ConfigDict(frozen=True)
+    
     tier: Literal["platinum", "standard", "budget"] = Field(
         description="Tier do departamento"
     )
@@ -45,6 +52,10 @@ class DepartmentConfig(BaseModel):
 
 class ModelPolicy(BaseModel):
     """Política completa de roteamento de modelos."""
+    # Imutável: a mesma instância é compartilhada pelo cache de
+    # load_model_policy entre todos os roteadores/estimadores do processo
+    model_config = ConfigDict(frozen=True)
+    
     departments: Dict[str, DepartmentConfig] = Field(
         description="Configurações por departamento"
     )
@@ -64,6 +75,17 @@ class ModelPolicy(BaseModel):
                     f"Modelos válidos: {valid_models}"
                 )
         return v
+    
+    @field_validator('departments', 'pricing')
+    @classmethod
+    def freeze_maps(cls, v):
+        """Expõe os mapas como somente leitura (MappingProxyType)."""
+        return MappingProxyType(v)
+    
+    @field_serializer('departments', 'pricing')
+    def serialize_maps(self, v):
+        """Serializa os mapas somente leitura como dicts comuns."""
+        return dict(v)
 
 
 # ============================================================================
@@ -83,3 +105,15 @@ class AuditResponse(BaseModel):
         description="Justificativa detalhada da análise"
     )
 
+
+class AuditResponseDict(TypedDict):
+    """
+    Forma em dicionário de AuditResponse (mesmos campos, sem validação).
+    
+    Usada onde a resposta já está no formato correto e só é lida por
+    indexação (ex: respostas simuladas em main.py), evitando construir e
+    serializar o modelo Pydantic a cada chamada.
+    """
+    compliance_status: Literal["APPROVED", "REJECTED", "REQUIRES_REVIEW"]
+    risk_level: Literal["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+    audit_reasoning: str
@@ -0,0 +1,280 @@
+"""
+Carregamento de Política - Governance Gateway
+Cache compartilhado da política YAML validada
+
+ModelRouter e CostEstimator leem o mesmo arquivo config/model_policy.yaml.
+Este módulo centraliza a leitura (YAML + validação Pydantic) em
+load_model_policy() e memoiza o resultado por caminho, mtime e tamanho do
+arquivo, de forma que os dois componentes (e instanciações repetidas)
+compartilham a mesma ModelPolicy já validada.
+
+Uso:
+    policy = load_model_policy(Path("config/model_policy.yaml"))
+    router = ModelRouter(policy=policy)
+    estimator = CostEstimator(policy=policy)
+
+Cache em disco (sidecar):
+Após a primeira validação, a política é gravada em JSON ao lado do YAML
+(<arquivo>.cache.json), com o mtime e o tamanho do YAML e a impressão
+digital do schema (ver _schema_fingerprint) na primeira linha. Em novos
+processos, se tudo confere, a política é lida do JSON e o parse YAML é
+evitado por completo. Como o sidecar só é gravado a partir de uma política
+já validada, ele é reconstruído com model_construct (sem revalidação).
+O JSON é lido/gravado com orjson quando disponível (fallback: json).
+
+PyYAML é importado sob demanda, apenas quando o YAML precisa ser lido:
+processos que carregam a política do sidecar nunca importam yaml.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Optional
+
+from pydantic import ValidationError
+
+from . import models
+from .models import ModelPolicy, DepartmentConfig, PricingModel
+from .exceptions import PolicyValidationError, PolicyNotFoundError
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Importação condicional: orjson (Rust) acelera o cache JSON; fallback para json
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Sufixo do cache JSON gravado ao lado do arquivo de política
+SIDECAR_SUFFIX = ".cache.json"
+
+
+def _sidecar_path(path_str: str) -> Path:
+    """Retorna o caminho do cache JSON associado ao arquivo de política."""
+    return Path(path_str + SIDECAR_SUFFIX)
+
+
+def _construct_trusted_policy(data: Dict[str, Any]) -> ModelPolicy:
+    """
+    Monta uma ModelPolicy a partir de dados confiáveis, SEM validação.
+
+    ⚠️ model_construct ignora completamente os validadores Pydantic (tipos,
+    ranges, tier 'standard' sem threshold, nomes de modelo). Use apenas com
+    dados que já passaram por ModelPolicy(**data) antes, como o sidecar JSON.
+    Os mapas aninhados também são construídos explicitamente, pois
+    model_construct não converte dicts em submodelos.
+
+    Args:
+        data: Dicionário no formato de ModelPolicy.model_dump()
+
+    Returns:
+        ModelPolicy com DepartmentConfig/PricingModel aninhados
+    """
+    departments = {
+        name: DepartmentConfig.model_construct(**cfg)
+        for name, cfg in data['departments'].items()
+    }
+    pricing = {
+        name: PricingModel.model_construct(**prices)
+        for name, prices in data['pricing'].items()
+    }
+    # Mesmos mapas somente leitura da carga validada (ver ModelPolicy.freeze_maps)
+    return ModelPolicy.model_construct(
+        departments=MappingProxyType(departments),
+        pricing=MappingProxyType(pricing)
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _schema_fingerprint() -> str:
+    """
+    Impressão digital das regras de validação da política.
+
+    Combina o JSON Schema de ModelPolicy com o código-fonte de models.py
+    (validadores customizados não aparecem no schema). Se as regras mudam,
+    sidecars gravados por versões anteriores deixam de ser aceitos e a
+    política volta a ser validada a partir do YAML.
+    """
+    digest = hashlib.sha256(
+        json.dumps(ModelPolicy.model_json_schema(), sort_keys=True).encode('utf-8')
+    )
+    try:
+        digest.update(inspect.getsource(models).encode('utf-8'))
+    except (OSError, TypeError):
+        # Sem código-fonte disponível (ex: apenas .pyc): só o schema conta
+        pass
+    return digest.hexdigest()[:16]
+
+
+def _file_stamp(mtime_ns: int, size: int) -> str:
+    """Identificação da versão do YAML e do schema gravada no cabeçalho do sidecar."""
+    return f"{mtime_ns}:{size}:{_schema_fingerprint()}"
+
+
+def _read_sidecar(path_str: str, stamp: str) -> Optional[ModelPolicy]:
+    """
+    Lê a política do cache JSON, se existir e estiver atualizado.
+
+    Qualquer problema (arquivo ausente, mtime/tamanho/schema divergente,
+    JSON corrompido) resulta em None, e o chamador volta para o caminho YAML.
+    """
+    sidecar = _sidecar_path(path_str)
+    try:
+        header, _, body = sidecar.read_bytes().partition(b"\n")
+        if header.decode('ascii').strip() != stamp:
+            logger.debug("Cache de política desatualizado: %s", sidecar)
+            return None
+        data = orjson.loads(body) if ORJSON_AVAILABLE else json.loads(body)
+        return _construct_trusted_policy(data)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+        # AttributeError/TypeError: JSON válido, mas fora do formato esperado
+        # (ex: "departments" que não é um objeto)
+        logger.warning(f"Cache de política ignorado ({sidecar}): {e}")
+        return None
+
+
+def _write_sidecar(path_str: str, stamp: str, policy: ModelPolicy) -> None:
+    """
+    Grava a política validada no cache JSON (melhor esforço).
+
+    A escrita é feita em arquivo temporário seguido de os.replace, para que
+    outro processo nunca leia um cache parcialmente gravado. Falhas de escrita
+    (ex: diretório somente leitura) apenas desativam o cache.
+    """
+    sidecar = _sidecar_path(path_str)
+    tmp_path = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        if ORJSON_AVAILABLE:
+            body = orjson.dumps(policy.model_dump(mode='json'))
+        else:
+            body = policy.model_dump_json().encode('utf-8')
+        tmp_path.write_bytes(f"{stamp}\n".encode('ascii') + body)
+        os.replace(tmp_path, sidecar)
+    except OSError as e:
+        logger.debug("Não foi possível gravar cache de política (%s): %s", sidecar, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _parse_yaml(path_str: str) -> Any:
+    """
+    Lê o arquivo YAML de política, importando PyYAML sob demanda.
+
+    Raises:
+        FileNotFoundError: Se o arquivo não existir
+        ValueError: Se o YAML estiver malformado
+    """
+    import yaml
+    # Parser YAML: usa os bindings C da LibYAML quando disponíveis (bem mais
+    # rápido), com fallback para o parser em Python puro
+    try:
+        from yaml import CSafeLoader as yaml_loader
+    except ImportError:
+        from yaml import SafeLoader as yaml_loader
+
+    try:
+        with open(path_str, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=yaml_loader)
+    except yaml.YAMLError as e:
+        logger.error(f"Erro ao processar YAML: {e}")
+        raise ValueError(f"Erro ao processar YAML: {e}") from e
+
+
+@functools.lru_cache(maxsize=32)
+def _load_policy_cached(
+    path_str: str,
+    mtime_ns: int,
+    size: int,
+    trusted: bool = False
+) -> ModelPolicy:
+    """
+    Lê e valida a política YAML, memoizando o resultado.
+
+    O mtime (em nanossegundos) e o tamanho fazem parte da chave do cache:
+    qualquer edição no arquivo invalida a entrada automaticamente, sem
+    necessidade de reiniciar o processo. O tamanho cobre edições que não
+    alteram o mtime (sistemas de arquivos com baixa resolução de tempo,
+    ferramentas que preservam o mtime). Exceções não são memoizadas.
+
+    Args:
+        path_str: Caminho absoluto do arquivo de política
+        mtime_ns: st_mtime_ns do arquivo no momento da leitura
+        size: st_size do arquivo no momento da leitura
+        trusted: Se True, o YAML é montado com model_construct, sem
+            validação Pydantic (ver _construct_trusted_policy)
+
+    Returns:
+        ModelPolicy validada (instância compartilhada entre chamadores;
+        imutável, com departments/pricing somente leitura)
+
+    Raises:
+        FileNotFoundError: Se o arquivo de política não existir
+        ValueError: Se o YAML estiver malformado
+        ValidationError: Se a estrutura não corresponder ao schema Pydantic
+    """
+    stamp = _file_stamp(mtime_ns, size)
+    policy = _read_sidecar(path_str, stamp)
+    if policy is not None:
+        logger.debug("Política carregada do cache JSON: %s", path_str)
+        return policy
+
+    logger.debug("Lendo política do disco: %s", path_str)
+    policy_data = _parse_yaml(path_str)
+    if trusted:
+        # Sem validação: não alimenta o sidecar, que outros processos
+        # tratam como política já validada
+        return _construct_trusted_policy(policy_data)
+    # model_validate (e não ModelPolicy(**data)) para que um YAML vazio ou
+    # que não seja um mapeamento também resulte em ValidationError
+    policy = ModelPolicy.model_validate(policy_data)
+    _write_sidecar(path_str, stamp, policy)
+    return policy
+
+
+def load_model_policy(policy_path: Path, trusted: bool = False) -> ModelPolicy:
+    """
+    Carrega a política de roteamento/preços, compartilhada entre componentes.
+
+    Ponto único de leitura de model_policy.yaml: ModelRouter e CostEstimator
+    delegam para esta função e apenas extraem .departments / .pricing da
+    mesma instância. Chamadas repetidas com o arquivo inalterado não fazem
+    I/O de YAML nem validação Pydantic.
+
+    Args:
+        policy_path: Caminho absoluto para o arquivo YAML de política
+        trusted: Se True, monta a política com model_construct, sem
+            validação Pydantic (ver _construct_trusted_policy)
+
+    Returns:
+        ModelPolicy validada
+
+    Raises:
+        PolicyNotFoundError: Se o arquivo de política não existir
+        ValueError: Se o YAML estiver malformado
+        PolicyValidationError: Se a estrutura não corresponder ao schema Pydantic
+    """
+    try:
+        logger.debug("Carregando política de: %s", policy_path)
+        # Cache por (caminho, mtime, tamanho): edições no arquivo invalidam
+        # o cache; em regime, o custo de uma chamada é um os.stat
+        st = os.stat(policy_path)
+        return _load_policy_cached(str(policy_path), st.st_mtime_ns, st.st_size, trusted)
+    except FileNotFoundError as e:
+        logger.error(f"Arquivo de política não encontrado: {policy_path}")
+        raise PolicyNotFoundError(
+            f"Arquivo de política não encontrado: {policy_path}"
+        ) from e
+    except ValidationError as e:
+        # Sem exc_info: a causa segue encadeada via "from e" para o chamador
+        logger.error(f"Erro de validação Pydantic: {e}")
+        raise PolicyValidationError(
+            f"Erro ao validar política: {e}. "
+            "Verifique se o YAML está no formato correto."
+        ) from e
@@ -26,23 +26,53 @@ Benefícios do padrão Router-Gateway:
 - Aula 03: O Gateway será implementado com chamadas reais ao Vertex AI
 """
 
-import yaml
 import logging
+import sys
 from pathlib import Path
-from typing import Dict, Any, Optional
-from pydantic import ValidationError
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional
 
 from .models import ModelPolicy, DepartmentConfig
 from .exceptions import (
     PolicyValidationError,
-    PolicyNotFoundError,
     DepartmentNotFoundError,
     InvalidComplexityError
 )
+from .policy_loader import load_model_policy
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Modelos disponíveis para roteamento
+PRO_MODEL = 'gemini-1.5-pro-001'
+FLASH_MODEL = 'gemini-1.5-flash-001'
+
+
+# ----------------------------------------------------------------------------
+# Lógica de Roteamento por Tier - Aula 01
+# ----------------------------------------------------------------------------
+# Cada tier vira um índice inteiro, resolvido uma única vez ao carregar a
+# política. route_request indexa uma tupla de modelos (sem comparações de
+# strings por requisição):
+#
+# - Platinum: Sempre usa Pro (máxima qualidade)
+#   Caso de uso: Departamento Jurídico - requisitos legais exigem precisão máxima
+# - Budget: Sempre usa Flash (otimização de custos)
+#   Caso de uso: Operações de TI - operações rotineiras não requerem modelo premium
+# - Standard: Decisão dinâmica baseada em complexidade
+#   Caso de uso: Recursos Humanos
+#   - Operações simples (< threshold): Flash economiza sem perder qualidade
+#   - Operações complexas (>= threshold): Pro garante precisão quando necessário
+TIER_PLATINUM = 0
+TIER_BUDGET = 1
+TIER_STANDARD = 2
+
+_TIER_INDEX: Dict[str, int] = {
+    'platinum': TIER_PLATINUM,
+    'budget': TIER_BUDGET,
+    'standard': TIER_STANDARD,
+}
+
 
 class ModelRouter:
     """
@@ -67,7 +97,11 @@ class ModelRouter:
     para validar a intenção do usuário antes de rotear para um modelo.
     """
     
-    def __init__(self, policy_path: str = "config/model_policy.yaml"):
+    def __init__(
+        self,
+        policy_path: str = "config/model_policy.yaml",
+        policy: Optional[ModelPolicy] = None
+    ):
         """
         Inicializa o roteador carregando a política do YAML.
         
@@ -79,20 +113,36 @@ class ModelRouter:
         
         Args:
             policy_path: Caminho para o arquivo YAML com política de roteamento
+            policy: Política já carregada (ex: a mesma usada pelo CostEstimator).
+                Se informada, o arquivo não é relido.
         """
         # Resolver caminho relativo à raiz do projeto
         project_root = Path(__file__).parent.parent
         self.policy_path = project_root / policy_path
         self.policy: Optional[ModelPolicy] = None
-        self.departments: Dict[str, DepartmentConfig] = {}
-        self._load_policy()
+        # Cópia somente leitura dos departamentos: as tabelas de roteamento
+        # são pré-computadas a partir dela (ver _build_route_table)
+        self.departments: Mapping[str, DepartmentConfig] = MappingProxyType({})
+        
+        self._tier_idx: Dict[str, int] = {}
+        self._thresholds: Dict[str, float] = {}
+        self._invalid_departments: Dict[str, str] = {}
+        
+        if policy is not None:
+            self.policy = policy
+            self.departments = MappingProxyType(dict(policy.departments))
+            self._build_route_table()
+        else:
+            self._load_policy()
     
-    def _load_policy(self) -> None:
+    def _load_policy(self, trusted: bool = False) -> None:
         """
         Carrega e valida a política de roteamento do arquivo YAML.
         
         Este método carrega o YAML, valida com Pydantic e armazena
-        a política validada na memória.
+        a política validada na memória. A leitura é delegada a
+        load_model_policy(), compartilhada com o CostEstimator e memoizada
+        por caminho, mtime e tamanho do arquivo.
         
         🏗️ Validação Pydantic - Aula 01:
         Pydantic garante que a política YAML está correta antes de usar.
@@ -102,42 +152,70 @@ class ModelRouter:
         A mesma validação Pydantic será usada para validar respostas JSON
         do LLM, garantindo que o modelo retornou dados no formato esperado.
         
+        Args:
+            trusted: Se True, monta a política com model_construct, sem
+                validação Pydantic. ⚠️ Use apenas para recarregar arquivos
+                que já foram validados antes; erros de configuração passam
+                despercebidos neste modo.
+        
         Raises:
             FileNotFoundError: Se o arquivo de política não existir
             ValueError: Se o YAML estiver malformado ou inválido
             ValidationError: Se a estrutura não corresponder ao schema Pydantic
         """
-        try:
-            logger.debug(f"Carregando política de: {self.policy_path}")
-            with open(self.policy_path, 'r', encoding='utf-8') as f:
-                policy_data = yaml.safe_load(f)
-            logger.debug("YAML carregado com sucesso")
-        except FileNotFoundError as e:
-            logger.error(f"Arquivo de política não encontrado: {self.policy_path}")
-            raise PolicyNotFoundError(
-                f"Arquivo de política não encontrado: {self.policy_path}"
-            ) from e
-        except yaml.YAMLError as e:
-            logger.error(f"Erro ao processar YAML: {e}")
-            raise ValueError(f"Erro ao processar YAML: {e}") from e
-        
-        # Validação com Pydantic
-        try:
-            logger.debug("Validando política com Pydantic")
-            self.policy = ModelPolicy(**policy_data)
-            self.departments = self.policy.departments
-            logger.info(f"Política validada: {len(self.departments)} departamentos configurados")
-        except ValidationError as e:
-            logger.error(f"Erro de validação Pydantic: {e}")
-            raise PolicyValidationError(
-                f"Erro ao validar política: {e}. "
-                "Verifique se o YAML está no formato correto."
-            ) from e
-        except Exception as e:
-            logger.error(f"Erro inesperado ao validar política: {e}", exc_info=True)
-            raise PolicyValidationError(
-                f"Erro inesperado ao validar política: {e}"
-            ) from e
+        self.policy = load_model_policy(self.policy_path, trusted=trusted)
+        self.departments = MappingProxyType(dict(self.policy.departments))
+        logger.info("Política validada: %d departamentos configurados", len(self.departments))
+        self._build_route_table()
+    
+    def _build_route_table(self) -> None:
+        """
+        Pré-computa o índice de tier e o threshold de cada departamento.
+        
+        A decisão por tier é resolvida aqui, uma vez por carga de política,
+        em vez de a cada chamada de route_request. As tabelas são dicts
+        planos com nomes de departamento internados (sys.intern), de modo
+        que chamadas com literais de string comparam chaves por identidade.
+        
+        Os DepartmentConfig originais continuam em self.departments: a
+        ModelPolicy é compartilhada via cache (load_model_policy), então
+        descartá-los aqui não liberaria memória. self.departments é uma
+        cópia somente leitura tirada junto com as tabelas, e os
+        DepartmentConfig são imutáveis (frozen): mesmo uma política montada
+        com dicts comuns (model_construct) e alterada depois não deixa as
+        tabelas defasadas em relação a self.departments. Para mudar a
+        política, edite o YAML e recarregue com _load_policy().
+        
+        Departamentos mal configurados (ex: carregados com trusted=True)
+        ficam fora das tabelas e só geram erro quando são roteados.
+        """
+        tier_idx = {}
+        thresholds = {}
+        invalid = {}
+        for department, dept_config in self.departments.items():
+            department = sys.intern(department)
+            tier = dept_config.tier
+            threshold = dept_config.complexity_threshold
+            idx = _TIER_INDEX.get(tier)
+            
+            if idx is None:
+                # Fallback: Tier não mapeado (erro de configuração)
+                invalid[department] = (
+                    f"Tier '{tier}' não suportado para departamento '{department}'"
+                )
+            elif idx == TIER_STANDARD and threshold is None:
+                # Validação: Tier standard requer threshold definido
+                invalid[department] = (
+                    f"Departamento '{department}' (tier standard) requer complexity_threshold"
+                )
+            else:
+                tier_idx[department] = idx
+                # Tiers fixos ignoram o threshold; 0.0 mantém a comparação válida
+                thresholds[department] = threshold if threshold is not None else 0.0
+        
+        self._tier_idx = tier_idx
+        self._thresholds = thresholds
+        self._invalid_departments = invalid
     
     def route_request(self, department: str, complexity_score: float) -> str:
         """
@@ -179,72 +257,35 @@ class ModelRouter:
             KeyError: Se o departamento não estiver na política
             ValueError: Se complexity_score estiver fora do range válido
         """
-        logger.debug(f"Roteando requisição: dept={department}, complexity={complexity_score}")
+        # Caminho de sucesso: logs com formatação lazy (%s), sem montar
+        # f-strings quando o nível de log está desabilitado
+        logger.debug("Roteando requisição: dept=%s, complexity=%s", department, complexity_score)
         
-        if department not in self.departments:
+        # Uma única busca resolve existência do departamento e seu tier
+        idx = self._tier_idx.get(department)
+        if idx is None:
+            message = self._invalid_departments.get(department)
+            if message is not None:
+                logger.error(message)
+                raise PolicyValidationError(message)
             logger.warning(f"Departamento não encontrado: {department}")
             raise DepartmentNotFoundError(
                 f"Departamento '{department}' não encontrado na política"
             )
         
+        # Comparação encadeada também rejeita NaN (toda comparação com NaN é False)
         if not 0.0 <= complexity_score <= 1.0:
             logger.warning(f"Complexity score inválido: {complexity_score}")
             raise InvalidComplexityError(
                 f"complexity_score deve estar entre 0.0 e 1.0, recebido: {complexity_score}"
             )
         
-        # Extrai configuração do departamento da política validada
-        dept_config = self.departments[department]
-        tier = dept_config.tier
-        fixed_model = dept_config.model  # Modelo fixo (se configurado)
-        threshold = dept_config.complexity_threshold
-        
-        # ------------------------------------------------------------------------
-        # Lógica de Roteamento por Tier - Aula 01
-        # ------------------------------------------------------------------------
-        
-        # Tier Platinum: Sempre usa Pro (máxima qualidade)
-        # Caso de uso: Departamento Jurídico
-        # Justificativa: Requisitos legais exigem precisão máxima, custo é secundário
-        if tier == 'platinum':
-            model = 'gemini-1.5-pro-001'
-            logger.info(f"Tier platinum selecionado: {model}")
-            return model
-        
-        # Tier Budget: Sempre usa Flash (otimização de custos)
-        # Caso de uso: Operações de TI
-        # Justificativa: Operações rotineiras não requerem modelo premium
-        if tier == 'budget':
-            model = 'gemini-1.5-flash-001'
-            logger.info(f"Tier budget selecionado: {model}")
-            return model
-        
-        # Tier Standard: Decisão dinâmica baseada em complexidade
-        # Caso de uso: Recursos Humanos
-        # Justificativa: Balanceamento entre custo e qualidade
-        # - Operações simples (< threshold): Flash economiza sem perder qualidade
-        # - Operações complexas (>= threshold): Pro garante precisão quando necessário
-        if tier == 'standard':
-            # Validação: Tier standard requer threshold definido
-            if threshold is None:
-                logger.error(f"Tier standard sem threshold: {department}")
-                raise PolicyValidationError(
-                    f"Departamento '{department}' (tier standard) requer complexity_threshold"
-                )
-            
-            # Decisão baseada em complexidade vs threshold
-            # Se complexidade baixa (< threshold): usa Flash (econômico)
-            # Se complexidade alta (>= threshold): usa Pro (precisão)
-            if complexity_score < threshold:
-                model = 'gemini-1.5-flash-001'
-                logger.info(f"Tier standard (complexidade baixa): {model}")
-            else:
-                model = 'gemini-1.5-pro-001'
-                logger.info(f"Tier standard (complexidade alta): {model}")
-            return model
-        
-        # Fallback: Tier não mapeado (erro de configuração)
-        logger.error(f"Tier não suportado: {tier} para {department}")
-        raise PolicyValidationError(
-            f"Tier '{tier}' não suportado para departamento '{department}'"
-        )
+        # Indexação por tier: (platinum, budget, standard). Uma busca, uma
+        # comparação e um acesso à tupla, sem comparar strings de tier
+        model = (
+            PRO_MODEL,
+            FLASH_MODEL,
+            FLASH_MODEL if complexity_score < self._thresholds[department] else PRO_MODEL
+        )[idx]
+        logger.info("Modelo selecionado para %s: %s", department, model)
+        return model
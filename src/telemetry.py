@@ -27,11 +27,11 @@ Uso:
     # Retorna custo em USD com 6 casas decimais
 """
 
-import yaml
-import logging
+import functools
+import os
 from pathlib import Path
-from typing import Dict, Any, Optional
-from pydantic import ValidationError
+from types import MappingProxyType
+from typing import Callable, Dict, Any, List, Mapping, Optional, Sequence, Tuple
 
 # Importação condicional: tiktoken para contagem precisa, fallback para aproximação
 try:
@@ -45,16 +45,50 @@ except ImportError:
         "Instale com: pip install tiktoken"
     )
 
+# Importação condicional: NumPy acelera apenas o cálculo de custos em massa
+# (calculate_costs); sem ele, o mesmo cálculo é feito em Python puro
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from .models import ModelPolicy, PricingModel
-from .exceptions import (
-    PolicyValidationError,
-    PolicyNotFoundError,
-    ModelNotFoundError
-)
+from .exceptions import ModelNotFoundError
+from .policy_loader import load_model_policy
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Textos maiores que este limite não são memoizados: evita que o cache
+# retenha prompts enormes na memória (até 4096 entradas)
+_TOKEN_CACHE_MAX_CHARS = 16_384
+
+
+@functools.lru_cache(maxsize=4096)
+def _count_tokens_cached(encoding_name: str, text: str) -> int:
+    """
+    Conta tokens com tiktoken, memoizando por (encoding, texto).
+    
+    Tokenização é determinística: em um gateway, os mesmos prompts e
+    templates se repetem com frequência, e um acerto no cache troca uma
+    passada de BPE por uma busca em dicionário.
+    """
+    return len(tiktoken.get_encoding(encoding_name).encode(text))
+
+
+def _make_cost_fn(input_price: float, output_price: float) -> Callable[[int, int], float]:
+    """
+    Gera a função de custo especializada de um modelo.
+    
+    Os preços por token ficam fixados como argumentos default (variáveis
+    locais na execução), então cada chamada é só aritmética: sem busca na
+    tabela de preços nem acesso a atributos.
+    """
+    def _calc(n_in: int, n_out: int, _a: float = input_price, _b: float = output_price) -> float:
+        return round(n_in * _a + n_out * _b, 6)
+    return _calc
+
 
 class CostEstimator:
     """
@@ -96,9 +130,15 @@ class CostEstimator:
     
     # Aproximação de fallback (usada apenas se tiktoken não disponível)
     # Baseada em média empírica: português/inglês ≈ 3.5-4.5 chars/token
+    # Se for um inteiro potência de 2, a divisão vira um deslocamento de bits
+    # (ver _chars_per_token_shift em __init__)
     CHARS_PER_TOKEN_FALLBACK = 4
     
-    def __init__(self, policy_path: str = "config/model_policy.yaml"):
+    def __init__(
+        self,
+        policy_path: str = "config/model_policy.yaml",
+        policy: Optional[ModelPolicy] = None
+    ):
         """
         Inicializa o estimador carregando a política de preços do YAML.
         
@@ -115,17 +155,48 @@ class CostEstimator:
         
         Args:
             policy_path: Caminho para o arquivo YAML com política de preços
+            policy: Política já carregada (ex: a mesma usada pelo ModelRouter).
+                Se informada, o arquivo não é relido.
         """
         # Resolver caminho relativo à raiz do projeto
         project_root = Path(__file__).parent.parent
         self.policy_path = project_root / policy_path
         self.policy: Optional[ModelPolicy] = None
-        self.pricing: Dict[str, PricingModel] = {}
+        # Cópia somente leitura dos preços: a tabela de preços é pré-computada,
+        # então nem uma política montada com dicts comuns (model_construct)
+        # pode mudar por baixo deste estimador
+        self.pricing: Mapping[str, PricingModel] = MappingProxyType({})
+        self._price_table: Dict[str, Tuple[float, float]] = {}
+        self._cost_fn: Dict[str, Callable[[int, int], float]] = {}
+        # Estrutura de arrays paralelos (SoA) indexada por id de modelo,
+        # usada nos cálculos em massa (ver calculate_costs)
+        self._model_names: List[str] = []
+        self._model_idx: Dict[str, int] = {}
+        self._in_prices: Any = None
+        self._out_prices: Any = None
+        
+        # log2 de CHARS_PER_TOKEN_FALLBACK, resolvido por instância para
+        # respeitar sobrescritas em subclasses/instâncias. None quando o
+        # valor não é um inteiro potência de 2 (ex: 3 ou 3.5): nesse caso a
+        # aproximação usa divisão inteira (ver _chars_to_tokens)
+        chars_per_token = self.CHARS_PER_TOKEN_FALLBACK
+        self._chars_per_token_shift: Optional[int] = None
+        if (
+            isinstance(chars_per_token, int)
+            and chars_per_token >= 1
+            and not chars_per_token & (chars_per_token - 1)
+        ):
+            self._chars_per_token_shift = chars_per_token.bit_length() - 1
         
         # Inicializar encoder de tokens (tiktoken)
         self._init_token_encoder()
         
-        self._load_pricing()
+        if policy is not None:
+            self.policy = policy
+            self.pricing = MappingProxyType(dict(policy.pricing))
+            self._build_price_table()
+        else:
+            self._load_pricing()
     
     def _init_token_encoder(self) -> None:
         """
@@ -156,54 +227,69 @@ class CostEstimator:
                 "Para precisão, instale: pip install tiktoken"
             )
     
-    def _load_pricing(self) -> None:
+    def _load_pricing(self, trusted: bool = False) -> None:
         """
         Carrega e valida a seção de pricing do arquivo YAML de política.
         
         Este método carrega o YAML, valida com Pydantic e extrai a seção
-        'pricing' com preços por modelo (input/output separados).
+        'pricing' com preços por modelo (input/output separados). A política
+        validada é compartilhada com o ModelRouter via load_model_policy().
         
         🏗️ Validação Pydantic - Aula 03:
         A validação robusta com Pydantic será expandida na Aula 03 para
         validar respostas JSON do LLM. Aqui validamos a configuração,
         lá validaremos o output do modelo.
         
+        Args:
+            trusted: Se True, monta a política com model_construct, sem
+                validação Pydantic. ⚠️ Use apenas para recarregar arquivos
+                que já foram validados antes; erros de configuração passam
+                despercebidos neste modo.
+        
         Raises:
             FileNotFoundError: Se o arquivo de política não existir
             ValueError: Se o YAML estiver malformado ou inválido
             ValidationError: Se a estrutura não corresponder ao schema Pydantic
         """
-        try:
-            logger.debug(f"Carregando política de preços de: {self.policy_path}")
-            with open(self.policy_path, 'r', encoding='utf-8') as f:
-                policy_data = yaml.safe_load(f)
-            logger.debug("YAML de preços carregado com sucesso")
-        except FileNotFoundError as e:
-            logger.error(f"Arquivo de política não encontrado: {self.policy_path}")
-            raise PolicyNotFoundError(
-                f"Arquivo de política não encontrado: {self.policy_path}"
-            ) from e
-        except yaml.YAMLError as e:
-            logger.error(f"Erro ao processar YAML: {e}")
-            raise ValueError(f"Erro ao processar YAML: {e}") from e
-        
-        # Validação com Pydantic
-        try:
-            logger.debug("Validando política de preços com Pydantic")
-            self.policy = ModelPolicy(**policy_data)
-            self.pricing = self.policy.pricing
-            logger.info(f"Política de preços validada: {len(self.pricing)} modelos configurados")
-        except ValidationError as e:
-            logger.error(f"Erro de validação Pydantic: {e}")
-            raise PolicyValidationError(
-                f"Erro ao validar política: {e}. "
-                "Verifique se o YAML está no formato correto."
-            ) from e
-        except Exception as e:
-            logger.error(f"Erro inesperado ao validar política: {e}", exc_info=True)
-            raise PolicyValidationError(
-                f"Erro inesperado ao validar política: {e}"
-            ) from e
+        self.policy = load_model_policy(self.policy_path, trusted=trusted)
+        self.pricing = MappingProxyType(dict(self.policy.pricing))
+        logger.info("Política de preços validada: %d modelos configurados", len(self.pricing))
+        self._build_price_table()
+    
+    def _build_price_table(self) -> None:
+        """
+        Pré-computa os preços por token de cada modelo como tupla de floats.
+        
+        Os preços do YAML são por 1k tokens; a divisão por 1000 é feita aqui,
+        uma única vez, e o cálculo de custo vira duas multiplicações e uma
+        soma, sem acesso a atributos do modelo Pydantic por chamada.
+        """
+        self._price_table = {
+            name: (
+                prices.input_per_1k_tokens / 1000.0,
+                prices.output_per_1k_tokens / 1000.0
+            )
+            for name, prices in self.pricing.items()
+        }
+        # Uma função de custo por modelo, com os preços embutidos
+        # (ver _make_cost_fn e calculate_cost_tokens)
+        self._cost_fn = {
+            name: _make_cost_fn(input_price, output_price)
+            for name, (input_price, output_price) in self._price_table.items()
+        }
+        
+        # Mesmos preços em arrays paralelos: o id de um modelo é sua posição
+        # em _model_names, e um lote de ids indexa _in_prices/_out_prices
+        # de uma só vez
+        self._model_names = list(self._price_table)
+        self._model_idx = {name: i for i, name in enumerate(self._model_names)}
+        if NUMPY_AVAILABLE:
+            self._in_prices = np.array(
+                [self._price_table[name][0] for name in self._model_names], dtype=np.float64
+            )
+            self._out_prices = np.array(
+                [self._price_table[name][1] for name in self._model_names], dtype=np.float64
+            )
     
     def _count_tokens(self, text: str) -> int:
         """
@@ -232,8 +318,9 @@ class CostEstimator:
         if self.token_encoder is not None:
             # Método preciso: usa encoding real
             try:
-                tokens = self.token_encoder.encode(text)
-                return len(tokens)
+                if len(text) <= _TOKEN_CACHE_MAX_CHARS:
+                    return _count_tokens_cached(self._ENCODING_NAME, text)
+                return len(self.token_encoder.encode(text))
             except Exception as e:
                 logger.warning(f"Erro ao contar tokens com tiktoken: {e}. Usando fallback.")
         
@@ -241,21 +328,69 @@ class CostEstimator:
         # Aproximação conservadora: assume 4 chars/token (média para português/inglês)
         # Nota: Esta aproximação pode errar em ±30% dependendo do conteúdo
         char_count = len(text)
-        tokens_approx = max(1, char_count // self.CHARS_PER_TOKEN_FALLBACK)
+        tokens_approx = self._chars_to_tokens(char_count)
         
-        if logger.isEnabledFor(logging.DEBUG):
-            logger.debug(
-                f"Tokenização por aproximação: {char_count} chars → ~{tokens_approx} tokens "
-                f"(precisão: ±30% estimado)"
-            )
+        logger.debug(
+            "Tokenização por aproximação: %d chars → ~%d tokens (precisão: ±30%% estimado)",
+            char_count, tokens_approx
+        )
         
         return tokens_approx
     
+    def _count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """
+        Conta tokens de vários textos de uma vez.
+        
+        Com tiktoken, usa encode_batch, que distribui os textos por um
+        ThreadPoolExecutor criado a cada chamada (o encode em Rust libera o
+        GIL). O número de threads é limitado ao tamanho do lote, para que
+        lotes pequenos não criem uma thread por núcleo. Útil para rollups
+        de telemetria e reprocessamento de lotes de requisições.
+        
+        Args:
+            texts: Textos para contar tokens
+            
+        Returns:
+            Número de tokens de cada texto, na mesma ordem
+        """
+        if self.token_encoder is not None:
+            try:
+                encoded = self.token_encoder.encode_batch(
+                    texts, num_threads=max(1, min(len(texts), os.cpu_count() or 1))
+                )
+                return [len(tokens) for tokens in encoded]
+            except Exception as e:
+                logger.warning(f"Erro ao contar tokens em lote com tiktoken: {e}. Usando fallback.")
+        
+        # Fallback: mesma aproximação por caracteres de _count_tokens
+        return [self._chars_to_tokens(len(text)) for text in texts]
+    
+    def _chars_to_tokens(self, char_count: int) -> int:
+        """
+        Aproxima tokens a partir de uma contagem de caracteres.
+        
+        Usada quando o chamador só conhece o tamanho do texto: evita alocar
+        uma string de N caracteres apenas para tokenizá-la (o que, além de
+        custoso, não traria informação real ao tiktoken).
+        
+        Args:
+            char_count: Número de caracteres
+            
+        Returns:
+            Número aproximado de tokens (mesma regra do fallback de _count_tokens)
+        """
+        if self._chars_per_token_shift is not None:
+            return max(1, char_count >> self._chars_per_token_shift)
+        return max(1, int(char_count // self.CHARS_PER_TOKEN_FALLBACK))
+    
     def calculate_cost(
         self, 
         model_name: str, 
-        input_chars: int, 
-        output_chars: int
+        input_chars: int = 0, 
+        output_chars: int = 0,
+        *,
+        input_tokens: Optional[int] = None,
+        output_tokens: Optional[int] = None
     ) -> float:
         """
         Calcula o custo total de uma operação com o modelo.
@@ -276,12 +411,17 @@ class CostEstimator:
         
         📚 Conexão Aula 03:
         Na Aula 03, quando integrarmos com Vertex AI real, a API retornará
-        usage_metadata com tokens exatos. Por enquanto, estimamos com tiktoken.
+        usage_metadata com tokens exatos, que podem ser passados diretamente
+        em input_tokens/output_tokens. Com apenas a contagem de caracteres,
+        os tokens são aproximados (CHARS_PER_TOKEN_FALLBACK); com o texto
+        real, use calculate_cost_from_text (tiktoken).
         
         Args:
             model_name: Nome do modelo (ex: 'gemini-1.5-pro-001')
             input_chars: Número de caracteres no input (será convertido para tokens)
             output_chars: Número de caracteres no output (será convertido para tokens)
+            input_tokens: Tokens de input já conhecidos (ignora input_chars)
+            output_tokens: Tokens de output já conhecidos (ignora output_chars)
             
         Returns:
             Custo total em USD com 6 casas decimais
@@ -289,39 +429,329 @@ class CostEstimator:
         Raises:
             KeyError: Se o modelo não estiver na política de preços
         """
-        logger.debug(f"Calculando custo: model={model_name}, input={input_chars} chars, output={output_chars} chars")
+        logger.debug(
+            "Calculando custo: model=%s, input=%d chars, output=%d chars",
+            model_name, input_chars, output_chars
+        )
+        
+        # ------------------------------------------------------------------------
+        # Passo 1: Converter caracteres para tokens
+        # ------------------------------------------------------------------------
+        # IMPORTANTE: Convertemos chars → tokens ANTES de calcular custo
+        # porque preços são por TOKEN, não por caractere.
+        # Sem o texto real, a conversão é aritmética (nenhuma string é alocada)
+        if input_tokens is None:
+            input_tokens = self._chars_to_tokens(input_chars)
+        if output_tokens is None:
+            output_tokens = self._chars_to_tokens(output_chars)
+        
+        return self._cost_from_tokens(model_name, input_tokens, output_tokens)
+    
+    def calculate_cost_tokens(self, model_name: str, input_tokens: int, output_tokens: int) -> float:
+        """
+        Calcula o custo a partir de contagens de tokens já conhecidas.
+        
+        Caminho enxuto para alto volume (ex: usage_metadata da API): delega
+        para a função especializada do modelo, sem logging por chamada.
         
-        if model_name not in self.pricing:
+        Args:
+            model_name: Nome do modelo (ex: 'gemini-1.5-pro-001')
+            input_tokens: Tokens de input
+            output_tokens: Tokens de output
+            
+        Returns:
+            Custo total em USD com 6 casas decimais
+            
+        Raises:
+            KeyError: Se o modelo não estiver na política de preços
+        """
+        cost_fn = self._cost_fn.get(model_name)
+        if cost_fn is None:
             logger.warning(f"Modelo não encontrado na política: {model_name}")
             raise ModelNotFoundError(
                 f"Modelo '{model_name}' não encontrado na política de preços"
             )
+        return cost_fn(input_tokens, output_tokens)
+    
+    def calculate_cost_from_text(
+        self,
+        model_name: str,
+        input_text: str,
+        output_text: str
+    ) -> float:
+        """
+        Calcula o custo de uma operação a partir dos textos reais.
         
-        # Obtém preços do modelo da política validada
-        model_pricing = self.pricing[model_name]
+        Conta tokens com tiktoken (ou fallback) sobre o prompt e a resposta
+        reais, o que é mais preciso que a aproximação por caracteres de
+        calculate_cost.
         
-        # ------------------------------------------------------------------------
-        # Passo 1: Converter caracteres para tokens (preciso)
-        # ------------------------------------------------------------------------
-        # IMPORTANTE: Convertemos chars → tokens ANTES de calcular custo
-        # porque preços são por TOKEN, não por caractere
-        input_text = " " * input_chars  # Placeholder: em produção seria o texto real
-        output_text = " " * output_chars  # Placeholder: em produção seria o texto real
+        Args:
+            model_name: Nome do modelo (ex: 'gemini-1.5-pro-001')
+            input_text: Prompt enviado ao modelo
+            output_text: Resposta retornada pelo modelo
+            
+        Returns:
+            Custo total em USD com 6 casas decimais
+            
+        Raises:
+            KeyError: Se o modelo não estiver na política de preços
+        """
+        return self._cost_from_tokens(
+            model_name,
+            self._count_tokens(input_text),
+            self._count_tokens(output_text)
+        )
+    
+    def calculate_cost_batch(
+        self,
+        model_name: str,
+        input_texts: List[str],
+        output_texts: List[str]
+    ) -> List[float]:
+        """
+        Calcula o custo de várias operações com o mesmo modelo.
+        
+        Equivale a chamar calculate_cost_from_text para cada par
+        (input, output), mas tokeniza todos os textos em lote
+        (ver _count_tokens_batch) e resolve o preço do modelo uma só vez.
         
-        # Nota: Para cálculo preciso, precisaríamos do texto real, não apenas chars
-        # Na Aula 03, quando tivermos a resposta real da API, usaremos o texto completo
-        input_tokens = self._count_tokens(input_text)
-        output_tokens = self._count_tokens(output_text)
+        Args:
+            model_name: Nome do modelo (ex: 'gemini-1.5-pro-001')
+            input_texts: Prompts enviados ao modelo
+            output_texts: Respostas do modelo (mesmo tamanho de input_texts)
+            
+        Returns:
+            Custo de cada operação em USD com 6 casas decimais
+            
+        Raises:
+            KeyError: Se o modelo não estiver na política de preços
+            ValueError: Se as listas tiverem tamanhos diferentes
+        """
+        if len(input_texts) != len(output_texts):
+            raise ValueError(
+                f"input_texts e output_texts devem ter o mesmo tamanho "
+                f"({len(input_texts)} != {len(output_texts)})"
+            )
+        
+        input_price, output_price = self._get_prices(model_name)
+        input_tokens = self._count_tokens_batch(input_texts)
+        output_tokens = self._count_tokens_batch(output_texts)
+        
+        costs = [
+            round(n_in * input_price + n_out * output_price, 6)
+            for n_in, n_out in zip(input_tokens, output_tokens)
+        ]
+        logger.info("Custo calculado em lote: %d operações para %s", len(costs), model_name)
+        return costs
+    
+    def calculate_costs(
+        self,
+        model_names: Sequence[str],
+        input_tokens: Sequence[int],
+        output_tokens: Sequence[int]
+    ) -> List[float]:
+        """
+        Calcula custos em massa para um log de requisições (modelos mistos).
+        
+        📊 FinOps - Rollups de Telemetria:
+        Para agregar custos de muitas requisições, chamar calculate_cost em
+        loop faz a aritmética uma linha por vez. Com NumPy, cada nome vira um
+        id de modelo e o lote inteiro é calculado em operações vetorizadas
+        (ver calculate_costs_by_id): custo = in_tokens * in_price + out_tokens * out_price.
+        
+        Args:
+            model_names: Modelo de cada requisição
+            input_tokens: Tokens de input de cada requisição
+            output_tokens: Tokens de output de cada requisição
+            
+        Returns:
+            Custo de cada requisição em USD com 6 casas decimais
+            
+        Raises:
+            KeyError: Se algum modelo não estiver na política de preços
+            ValueError: Se as sequências tiverem tamanhos diferentes
+        """
+        if not len(model_names) == len(input_tokens) == len(output_tokens):
+            raise ValueError(
+                "model_names, input_tokens e output_tokens devem ter o mesmo tamanho"
+            )
+        
+        if not NUMPY_AVAILABLE:
+            return [
+                self._cost_from_tokens(name, n_in, n_out)
+                for name, n_in, n_out in zip(model_names, input_tokens, output_tokens)
+            ]
+        
+        model_ids = [self.model_id(name) for name in model_names]
+        return self.calculate_costs_by_id(model_ids, input_tokens, output_tokens)
+    
+    def calculate_costs_from_chars(
+        self,
+        model_names: Sequence[str],
+        input_chars: Sequence[int],
+        output_chars: Sequence[int]
+    ) -> List[float]:
+        """
+        Calcula custos em massa a partir de contagens de caracteres.
+        
+        Equivale a chamar calculate_cost(model, input_chars, output_chars)
+        para cada requisição: os caracteres são aproximados em tokens
+        (CHARS_PER_TOKEN_FALLBACK) e o lote segue para calculate_costs.
+        
+        Args:
+            model_names: Modelo de cada requisição
+            input_chars: Caracteres de input de cada requisição
+            output_chars: Caracteres de output de cada requisição
+            
+        Returns:
+            Custo de cada requisição em USD com 6 casas decimais
+            
+        Raises:
+            KeyError: Se algum modelo não estiver na política de preços
+            ValueError: Se as sequências tiverem tamanhos diferentes
+        """
+        return self.calculate_costs(
+            model_names,
+            [self._chars_to_tokens(n) for n in input_chars],
+            [self._chars_to_tokens(n) for n in output_chars]
+        )
+    
+    def calculate_costs_by_id(
+        self,
+        model_ids: Sequence[int],
+        input_tokens: Sequence[int],
+        output_tokens: Sequence[int]
+    ) -> List[float]:
+        """
+        Calcula custos em massa a partir de ids de modelo (ver model_id).
+        
+        Variante de calculate_costs para logs que já armazenam o modelo como
+        id inteiro: com NumPy, o cálculo inteiro é uma passada vetorizada
+        sobre os arrays de preços (_in_prices/_out_prices), sem nenhum
+        trabalho Python por linha.
+        
+        Args:
+            model_ids: Id do modelo de cada requisição
+            input_tokens: Tokens de input de cada requisição
+            output_tokens: Tokens de output de cada requisição
+            
+        Returns:
+            Custo de cada requisição em USD com 6 casas decimais
+            
+        Raises:
+            IndexError: Se algum id não corresponder a um modelo da política
+            TypeError: Se algum id não for inteiro (ex: float ou bool)
+            ValueError: Se as sequências tiverem tamanhos diferentes
+        """
+        if not len(model_ids) == len(input_tokens) == len(output_tokens):
+            raise ValueError(
+                "model_ids, input_tokens e output_tokens devem ter o mesmo tamanho"
+            )
+        
+        # Ids precisam ser inteiros no intervalo [0, n_models): a indexação
+        # aceitaria ids negativos (contando do fim da lista/array), e a
+        # conversão para intp truncaria floats (0.9 -> 0) e bools (True -> 1),
+        # cobrando o preço de outro modelo. Os dois caminhos rejeitam igual
+        n_models = len(self._model_names)
+        use_numpy = NUMPY_AVAILABLE and self._in_prices is not None
+        if use_numpy:
+            ids = np.asarray(model_ids)
+            if ids.size and ids.dtype.kind not in 'iu':
+                raise TypeError(f"Ids de modelo devem ser inteiros, recebido: {ids.dtype}")
+            ids = ids.astype(np.intp, copy=False)
+            invalid = ids[(ids < 0) | (ids >= n_models)].tolist()
+        else:
+            for i in model_ids:
+                if isinstance(i, bool) or not isinstance(i, int):
+                    raise TypeError(
+                        f"Ids de modelo devem ser inteiros, recebido: {type(i).__name__}"
+                    )
+            invalid = [i for i in model_ids if not 0 <= i < n_models]
+        if invalid:
+            raise IndexError(
+                f"Ids de modelo inválidos: {invalid} (válidos: 0 a {n_models - 1})"
+            )
+        
+        if use_numpy:
+            costs = (
+                np.asarray(input_tokens, dtype=np.int64) * self._in_prices[ids]
+                + np.asarray(output_tokens, dtype=np.int64) * self._out_prices[ids]
+            )
+            # round() do Python (não np.round, que arredonda meio-para-par em
+            # binário) mantém os valores idênticos aos de calculate_cost
+            results = [round(cost, 6) for cost in costs.tolist()]
+        else:
+            results = [
+                self._cost_fn[self._model_names[i]](n_in, n_out)
+                for i, n_in, n_out in zip(model_ids, input_tokens, output_tokens)
+            ]
+        logger.info("Custos calculados em massa: %d requisições", len(results))
+        return results
+    
+    def model_id(self, model_name: str) -> int:
+        """
+        Retorna o id inteiro do modelo (posição nos arrays de preços), para
+        uso em calculate_costs_by_id.
+        
+        Raises:
+            KeyError: Se o modelo não estiver na política de preços
+        """
+        model_id = self._model_idx.get(model_name)
+        if model_id is None:
+            logger.warning(f"Modelo não encontrado na política: {model_name}")
+            raise ModelNotFoundError(
+                f"Modelo '{model_name}' não encontrado na política de preços"
+            )
+        return model_id
+    
+    def _get_prices(self, model_name: str) -> Tuple[float, float]:
+        """
+        Retorna os preços por token (input, output) de um modelo.
+        
+        Raises:
+            KeyError: Se o modelo não estiver na política de preços
+        """
+        # Preços por token pré-computados (ver _build_price_table)
+        prices = self._price_table.get(model_name)
+        if prices is None:
+            logger.warning(f"Modelo não encontrado na política: {model_name}")
+            raise ModelNotFoundError(
+                f"Modelo '{model_name}' não encontrado na política de preços"
+            )
+        return prices
+    
+    def _cost_from_tokens(
+        self,
+        model_name: str,
+        input_tokens: int,
+        output_tokens: int
+    ) -> float:
+        """
+        Aplica a tabela de preços do modelo a contagens de tokens.
+        
+        Args:
+            model_name: Nome do modelo (ex: 'gemini-1.5-pro-001')
+            input_tokens: Tokens de input
+            output_tokens: Tokens de output
+            
+        Returns:
+            Custo total em USD com 6 casas decimais
+            
+        Raises:
+            KeyError: Se o modelo não estiver na política de preços
+        """
+        input_price, output_price = self._get_prices(model_name)
         
-        logger.debug(f"Tokens calculados: input={input_tokens}, output={output_tokens}")
+        logger.debug("Tokens calculados: input=%d, output=%d", input_tokens, output_tokens)
         
         # ------------------------------------------------------------------------
         # Passo 2: Calcular custos (preços no YAML são por 1k tokens)
         # ------------------------------------------------------------------------
-        # Exemplo: 500 tokens = 0.5 * preço_por_1k
-        # Usa os atributos do modelo Pydantic validado
-        input_cost = (input_tokens / 1000.0) * model_pricing.input_per_1k_tokens
-        output_cost = (output_tokens / 1000.0) * model_pricing.output_per_1k_tokens
+        # Exemplo: 500 tokens = 0.5 * preço_por_1k = 500 * preço_por_token
+        # A divisão por 1000 já está embutida nos preços da tabela
+        input_cost = input_tokens * input_price
+        output_cost = output_tokens * output_price
         
         # ------------------------------------------------------------------------
         # Passo 3: Custo total = input + output
@@ -334,5 +764,5 @@ class CostEstimator:
         # 6 casas decimais permitem rastrear custos de requisições individuais
         # mesmo quando muito pequenos (ex: $0.000123 USD)
         cost_rounded = round(total_cost, 6)
-        logger.info(f"Custo calculado: ${cost_rounded:.6f} USD para {model_name}")
+        logger.info("Custo calculado: $%.6f USD para %s", cost_rounded, model_name)
         return cost_rounded
@@ -0,0 +1,29 @@
+"""
+Configuração compartilhada dos testes
+"""
+
+import pytest
+from pathlib import Path
+
+import src.policy_loader as policy_loader
+
+# Diretório de configuração versionado do projeto
+_CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+
+
+@pytest.fixture(autouse=True)
+def no_policy_sidecar_in_config(monkeypatch):
+    """
+    Impede que a suíte grave o cache JSON da política em config/.
+    
+    Testes que usam a política padrão (ModelRouter(), CostEstimator(), main)
+    gravariam config/model_policy.yaml.cache.json na árvore do projeto.
+    Políticas em diretórios temporários continuam gravando o sidecar.
+    """
+    write_sidecar = policy_loader._write_sidecar
+    
+    def guarded_write_sidecar(path_str, stamp, policy):
+        if Path(path_str).resolve().parent != _CONFIG_DIR:
+            write_sidecar(path_str, stamp, policy)
+    
+    monkeypatch.setattr(policy_loader, "_write_sidecar", guarded_write_sidecar)
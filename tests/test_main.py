@@ -29,6 +29,35 @@ class TestPromptTemplate:
         
         assert user_request in prompt
     
+    def test_render_prompt_template_reuses_compiled_template(self):
+        """Testa que o template é compilado uma vez e reaproveitado."""
+        from src.main import _JINJA_ENV
+        
+        render_prompt_template("Primeira solicitação")
+        template = _JINJA_ENV.get_template("audit_master.jinja2")
+        
+        assert "Segunda solicitação" in render_prompt_template("Segunda solicitação")
+        assert _JINJA_ENV.get_template("audit_master.jinja2") is template
+    
+    def test_bytecode_cache_failure_is_not_fatal(self, monkeypatch):
+        """Testa que um diretório de cache inseguro apenas desativa o cache em disco."""
+        from src import main as main_module
+        
+        def unsafe_cache():
+            raise RuntimeError("Cannot determine safe temp directory")
+        
+        monkeypatch.setattr(main_module, "FileSystemBytecodeCache", unsafe_cache)
+        assert main_module._make_bytecode_cache() is None
+    
+    def test_render_prompt_template_memoized(self):
+        """Testa que solicitações repetidas reaproveitam o prompt renderizado."""
+        user_request = "Solicitação repetida para o cache"
+        first = render_prompt_template(user_request)
+        hits_before = render_prompt_template.cache_info().hits
+        
+        assert render_prompt_template(user_request) is first
+        assert render_prompt_template.cache_info().hits == hits_before + 1
+    
     def test_render_prompt_template_missing_file(self):
         """Testa erro com arquivo de template inexistente."""
         # Jinja2 pode lançar TemplateNotFound ou ValueError
@@ -73,6 +102,32 @@ class TestSimulateLLMResponse:
             assert response["compliance_status"] == "REJECTED"
             assert response["risk_level"] == "HIGH"
     
+    def test_simulate_llm_response_keyword_priority(self):
+        """Testa que exclusão tem prioridade sobre operação financeira e consulta."""
+        cases = {
+            "Consultar extrato e APAGAR o histórico": "REJECTED",
+            "Consultar saldo antes do PIX": "REQUIRES_REVIEW",
+            "CONSULTA de extrato": "APPROVED",
+        }
+        for request, expected in cases.items():
+            response = simulate_llm_response("gemini-1.5-pro-001", request)
+            assert response["compliance_status"] == expected
+    
+    def test_mock_responses_match_schema(self):
+        """Testa que todas as respostas pré-montadas seguem o schema AuditResponse."""
+        from src.main import _MOCK_RESPONSES
+        from src.models import AuditResponse
+        
+        for response in _MOCK_RESPONSES.values():
+            assert AuditResponse.model_validate(response).model_dump() == response
+    
+    def test_simulate_llm_response_returns_copy(self):
+        """Testa que alterar a resposta não afeta chamadas seguintes."""
+        response = simulate_llm_response("gemini-1.5-pro-001", "Consultar saldo")
+        response["risk_level"] = "CRITICAL"
+        
+        assert simulate_llm_response("gemini-1.5-pro-001", "Consultar saldo")["risk_level"] == "LOW"
+    
     def test_simulate_llm_response_pro_vs_flash(self):
         """Testa diferença entre respostas Pro e Flash."""
         response_pro = simulate_llm_response(
@@ -110,6 +165,29 @@ class TestSimulateInputOutput:
         # Output deve incluir o JSON da resposta
         assert output_chars > 0
     
+    def test_simulate_input_output_matches_rendered_prompt(self):
+        """Testa que o tamanho do input é o do prompt realmente renderizado."""
+        response = {"compliance_status": "APPROVED", "risk_level": "LOW", "audit_reasoning": "Teste"}
+        
+        for user_request in ["", "Consultar saldo", "Transferência de R$ 50.000 \"urgente\""]:
+            input_chars, _ = simulate_input_output(user_request, response)
+            assert input_chars == len(render_prompt_template(user_request))
+    
+    def test_simulate_input_output_compact_json_size(self):
+        """Testa que o tamanho do output é o do JSON compacto da resposta."""
+        import json
+        
+        responses = [
+            simulate_llm_response("gemini-1.5-pro-001", "Consultar saldo"),
+            {"compliance_status": "APPROVED", "risk_level": "LOW", "audit_reasoning": "Análise concluída"},
+            {"score": 0.5, "flags": ["pix"]},
+            {"risks": [{"level": "HIGH", "score": 97, "blocked": True}], "notes": None, "tags": [], "ok": False},
+            {},
+        ]
+        for response in responses:
+            _, output_chars = simulate_input_output("Consultar saldo", response)
+            assert output_chars == len(json.dumps(response, ensure_ascii=False, separators=(',', ':')))
+    
     def test_simulate_input_output_proportional(self):
         """Testa que tamanhos são proporcionais."""
         short_request = "Curto"
@@ -126,3 +204,26 @@ class TestSimulateInputOutput:
         
         assert input_long > input_short
 
+
+class TestMain:
+    """Testes para a demonstração completa (main)."""
+    
+    def test_main_cost_failure_skips_only_affected_scenario(self, monkeypatch, capsys):
+        """Testa que um modelo sem preço descarta apenas o próprio cenário."""
+        from src import main as main_module
+        
+        original_route = main_module.ModelRouter.route_request
+        
+        def route_request(self, department, complexity_score):
+            if department == "hr_dept":
+                return "gemini-unknown"
+            return original_route(self, department, complexity_score)
+        
+        monkeypatch.setattr(main_module.ModelRouter, "route_request", route_request)
+        main_module.main()
+        output = capsys.readouterr().out
+        
+        assert "Erro no cálculo de custo (Cenário 2)" in output
+        assert "Resposta do Auditor - Cenário 1" in output
+        assert "Resposta do Auditor - Cenário 2" not in output
+        assert "Resposta do Auditor - Cenário 3" in output
@@ -9,7 +9,8 @@ from src.models import (
     PricingModel,
     DepartmentConfig,
     ModelPolicy,
-    AuditResponse
+    AuditResponse,
+    AuditResponseDict
 )
 
 
@@ -180,4 +181,7 @@ class TestAuditResponse:
                 risk_level="LOW",
                 audit_reasoning="Curto"  # Menos de 10 caracteres
             )
-
+    
+    def test_dict_form_matches_model_fields(self):
+        """Testa que AuditResponseDict tem exatamente os campos de AuditResponse."""
+        assert set(AuditResponseDict.__annotations__) == set(AuditResponse.model_fields)
@@ -0,0 +1,203 @@
+"""
+Testes Unitários - Carregamento de Política (policy_loader)
+"""
+
+import os
+import pytest
+from pathlib import Path
+import yaml
+from pydantic import ValidationError
+
+import src.policy_loader as policy_loader
+from src.exceptions import PolicyValidationError
+from src.models import DepartmentConfig
+from src.policy_loader import (
+    SIDECAR_SUFFIX,
+    _file_stamp,
+    _load_policy_cached,
+    _schema_fingerprint,
+    load_model_policy,
+)
+
+
+def _write_policy(tmp_path: Path, policy_data) -> Path:
+    """Grava a política em um YAML temporário e retorna o caminho."""
+    policy_path = tmp_path / "model_policy.yaml"
+    policy_path.write_text(yaml.safe_dump(policy_data), encoding='utf-8')
+    return policy_path
+
+
+class TestLoadModelPolicy:
+    """Testes para load_model_policy (cache em memória e sidecar JSON)."""
+    
+    def test_load_model_policy_reuses_cached_policy(self, tmp_path):
+        """Testa que cargas repetidas compartilham a política já validada."""
+        policy_path = _write_policy(tmp_path, {"departments": {}, "pricing": {}})
+        
+        assert load_model_policy(policy_path) is load_model_policy(policy_path)
+    
+    def test_load_model_policy_reloads_on_file_change(self, tmp_path):
+        """Testa que alterar o arquivo (mtime) invalida o cache da política."""
+        policy_data = {
+            "departments": {
+                "legal_dept": {"tier": "platinum", "model": "gemini-1.5-pro-001"}
+            },
+            "pricing": {
+                "gemini-1.5-pro-001": {
+                    "input_per_1k_tokens": 0.00125,
+                    "output_per_1k_tokens": 0.00500
+                }
+            }
+        }
+        policy_path = _write_policy(tmp_path, policy_data)
+        assert load_model_policy(policy_path).departments["legal_dept"].tier == "platinum"
+        
+        policy_data["departments"]["legal_dept"] = {
+            "tier": "budget", "model": "gemini-1.5-flash-001"
+        }
+        policy_path.write_text(yaml.safe_dump(policy_data), encoding='utf-8')
+        stat = policy_path.stat()
+        os.utime(policy_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        assert load_model_policy(policy_path).departments["legal_dept"].tier == "budget"
+    
+    def test_load_model_policy_reloads_on_size_change_with_same_mtime(self, tmp_path):
+        """Testa que uma edição que preserva o mtime invalida o cache pelo tamanho."""
+        policy_data = {
+            "departments": {
+                "legal_dept": {"tier": "platinum", "model": "gemini-1.5-pro-001"}
+            },
+            "pricing": {}
+        }
+        policy_path = _write_policy(tmp_path, policy_data)
+        assert load_model_policy(policy_path).departments["legal_dept"].tier == "platinum"
+        
+        stat = policy_path.stat()
+        policy_data["departments"]["legal_dept"] = {"tier": "budget"}
+        policy_path.write_text(yaml.safe_dump(policy_data), encoding='utf-8')
+        os.utime(policy_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert policy_path.stat().st_size != stat.st_size
+        
+        assert load_model_policy(policy_path).departments["legal_dept"].tier == "budget"
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_load_model_policy_writes_and_reads_json_sidecar(self, use_orjson, tmp_path, monkeypatch):
+        """Testa que a política validada é gravada e relida do cache JSON."""
+        if use_orjson and not policy_loader.ORJSON_AVAILABLE:
+            pytest.skip("orjson não instalado")
+        monkeypatch.setattr(policy_loader, "ORJSON_AVAILABLE", use_orjson)
+        policy_data = {
+            "departments": {
+                "hr_dept": {"tier": "standard", "complexity_threshold": 0.5}
+            },
+            "pricing": {
+                "gemini-1.5-flash-001": {
+                    "input_per_1k_tokens": 0.000075,
+                    "output_per_1k_tokens": 0.00030
+                }
+            }
+        }
+        policy_path = _write_policy(tmp_path, policy_data)
+        sidecar = Path(f"{policy_path}{SIDECAR_SUFFIX}")
+        
+        load_model_policy(policy_path)
+        assert sidecar.exists()
+        header = sidecar.read_text(encoding='utf-8').splitlines()[0]
+        stat = policy_path.stat()
+        assert header == f"{stat.st_mtime_ns}:{stat.st_size}:{_schema_fingerprint()}"
+        
+        # Novo "processo": sem cache em memória, YAML inválido no disco.
+        # Com mtime e tamanho preservados, a política vem do sidecar JSON.
+        policy_path.write_text(
+            "invalid: yaml: content: [".ljust(stat.st_size), encoding='utf-8'
+        )
+        os.utime(policy_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        _load_policy_cached.cache_clear()
+        
+        policy = load_model_policy(policy_path)
+        assert isinstance(policy.departments["hr_dept"], DepartmentConfig)
+        assert policy.departments["hr_dept"].complexity_threshold == 0.5
+        assert policy.pricing["gemini-1.5-flash-001"].input_per_1k_tokens == 0.000075
+    
+    def test_load_model_policy_ignores_sidecar_from_other_schema(self, tmp_path):
+        """Testa que um sidecar gravado com outro schema é revalidado pelo YAML."""
+        policy_path = _write_policy(tmp_path, {"departments": {}, "pricing": {}})
+        
+        # Sidecar inválido para o schema atual, mas com mtime/tamanho corretos
+        stat = policy_path.stat()
+        Path(f"{policy_path}{SIDECAR_SUFFIX}").write_text(
+            f"{stat.st_mtime_ns}:{stat.st_size}:0000000000000000\n"
+            '{"departments": {"x": {"tier": "gold"}}, "pricing": '
+            '{"unknown": {"input_per_1k_tokens": -1, "output_per_1k_tokens": -1}}}',
+            encoding='utf-8'
+        )
+        _load_policy_cached.cache_clear()
+        
+        policy = load_model_policy(policy_path)
+        assert len(policy.departments) == 0
+        assert len(policy.pricing) == 0
+    
+    @pytest.mark.parametrize("body", [
+        '{"departments": 1, "pricing": {}}',
+        '{"departments": {"hr_dept": 1}, "pricing": {}}',
+        '[]',
+    ])
+    def test_load_model_policy_ignores_malformed_sidecar(self, body, tmp_path):
+        """Testa que um sidecar JSON com formato inesperado cai para o YAML."""
+        policy_path = _write_policy(
+            tmp_path, {"departments": {"it_ops": {"tier": "budget"}}, "pricing": {}}
+        )
+        stat = policy_path.stat()
+        Path(f"{policy_path}{SIDECAR_SUFFIX}").write_text(
+            f"{_file_stamp(stat.st_mtime_ns, stat.st_size)}\n{body}", encoding='utf-8'
+        )
+        _load_policy_cached.cache_clear()
+        
+        policy = load_model_policy(policy_path)
+        assert policy.departments["it_ops"].tier == "budget"
+    
+    def test_load_model_policy_trusted_skips_validation(self, tmp_path):
+        """Testa carga confiável (model_construct) sem validação Pydantic."""
+        # Threshold fora do range: rejeitado na carga normal, aceito em modo trusted
+        policy_path = _write_policy(tmp_path, {
+            "departments": {
+                "hr_dept": {"tier": "standard", "complexity_threshold": 1.5}
+            },
+            "pricing": {}
+        })
+        
+        with pytest.raises(PolicyValidationError):
+            load_model_policy(policy_path)
+        
+        policy = load_model_policy(policy_path, trusted=True)
+        assert isinstance(policy.departments["hr_dept"], DepartmentConfig)
+        assert policy.departments["hr_dept"].complexity_threshold == 1.5
+        # Política não validada não alimenta o sidecar
+        assert not Path(f"{policy_path}{SIDECAR_SUFFIX}").exists()
+    
+    @pytest.mark.parametrize("source", ["yaml", "sidecar", "trusted"])
+    def test_load_model_policy_is_read_only(self, source, tmp_path):
+        """Testa que a política compartilhada pelo cache não pode ser alterada."""
+        policy_path = _write_policy(
+            tmp_path, {"departments": {"it_ops": {"tier": "budget"}}, "pricing": {}}
+        )
+        if source == "sidecar":
+            load_model_policy(policy_path)
+            _load_policy_cached.cache_clear()
+        policy = load_model_policy(policy_path, trusted=source == "trusted")
+        
+        with pytest.raises(TypeError):
+            policy.departments["new_dept"] = DepartmentConfig(tier="budget")
+        with pytest.raises(TypeError):
+            del policy.departments["it_ops"]
+        with pytest.raises(ValidationError):
+            policy.pricing = {}
+        assert list(load_model_policy(policy_path, trusted=source == "trusted").departments) == ["it_ops"]
+    
+    def test_load_model_policy_with_empty_yaml(self, tmp_path):
+        """Testa erro de validação ao carregar YAML vazio."""
+        policy_path = tmp_path / "model_policy.yaml"
+        policy_path.touch()
+        
+        with pytest.raises(PolicyValidationError):
+            load_model_policy(policy_path)
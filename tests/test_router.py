@@ -6,7 +6,10 @@ import pytest
 from pathlib import Path
 import tempfile
 import yaml
+from pydantic import ValidationError
 
+from src.exceptions import PolicyValidationError
+from src.models import DepartmentConfig, ModelPolicy
 from src.router import ModelRouter
 
 
@@ -84,6 +87,13 @@ class TestModelRouter:
         
         assert "complexity_score deve estar entre 0.0 e 1.0" in str(exc_info.value)
     
+    def test_route_invalid_complexity_nan(self):
+        """Testa erro com complexity_score NaN."""
+        router = ModelRouter()
+        
+        with pytest.raises(ValueError):
+            router.route_request("hr_dept", float("nan"))
+    
     def test_route_boundary_values(self):
         """Testa valores de boundary (0.0 e 1.0)."""
         router = ModelRouter()
@@ -128,3 +138,88 @@ class TestModelRouterWithCustomPolicy:
         with pytest.raises(FileNotFoundError):
             router = ModelRouter(policy_path="config/nonexistent.yaml")
 
+    
+    def test_router_reuses_cached_policy(self):
+        """Testa que instâncias repetidas compartilham a política já validada."""
+        router_a = ModelRouter()
+        router_b = ModelRouter()
+        
+        assert router_a.policy is router_b.policy
+    
+    def test_router_departments_are_read_only(self):
+        """Testa que alterar departments não vaza para outras instâncias."""
+        router = ModelRouter()
+        
+        with pytest.raises(TypeError):
+            router.departments["new_dept"] = DepartmentConfig(tier="budget")
+        with pytest.raises(TypeError):
+            router.policy.departments["new_dept"] = DepartmentConfig(tier="budget")
+        with pytest.raises(ValidationError):
+            router.policy.departments = {}
+        
+        fresh = ModelRouter()
+        assert "new_dept" not in fresh.departments
+        assert "new_dept" not in fresh.policy.departments
+    
+    def test_router_department_configs_are_immutable(self):
+        """Testa que a configuração usada pela tabela de roteamento não muda."""
+        router = ModelRouter()
+        
+        with pytest.raises(ValidationError):
+            router.departments["hr_dept"].tier = "platinum"
+        assert router.route_request("hr_dept", 0.1) == "gemini-1.5-flash-001"
+    
+    def test_router_trusted_reload_skips_validation(self):
+        """Testa recarga confiável (model_construct) sem validação Pydantic."""
+        # Threshold fora do range: rejeitado na carga normal, aceito em modo trusted
+        policy_data = {
+            "departments": {
+                "hr_dept": {"tier": "standard", "complexity_threshold": 1.5}
+            },
+            "pricing": {}
+        }
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.safe_dump(policy_data, f)
+            temp_path = Path(f.name)
+        
+        try:
+            with pytest.raises(PolicyValidationError):
+                ModelRouter(policy_path=str(temp_path))
+            
+            router = ModelRouter()
+            router.policy_path = temp_path
+            router._load_policy(trusted=True)
+            
+            assert isinstance(router.departments["hr_dept"], DepartmentConfig)
+            assert router.departments["hr_dept"].complexity_threshold == 1.5
+        finally:
+            temp_path.unlink()
+    
+    def test_router_departments_snapshot_matches_route_table(self):
+        """Testa que departments não muda com edições na política de origem."""
+        departments = {"it_ops": DepartmentConfig(tier="budget")}
+        policy = ModelPolicy.model_construct(departments=departments, pricing={})
+        router = ModelRouter(policy=policy)
+        
+        departments["legal_dept"] = DepartmentConfig(tier="platinum")
+        del departments["it_ops"]
+        
+        assert list(router.departments) == ["it_ops"]
+        assert router.route_request("it_ops", 0.5) == "gemini-1.5-flash-001"
+    
+    def test_route_standard_without_threshold_raises(self):
+        """Testa que tier standard sem threshold falha apenas ao rotear."""
+        policy = ModelPolicy.model_construct(
+            departments={
+                "hr_dept": DepartmentConfig.model_construct(tier="standard"),
+                "it_ops": DepartmentConfig.model_construct(tier="budget"),
+            },
+            pricing={}
+        )
+        router = ModelRouter(policy=policy)
+        
+        assert router.route_request("it_ops", 0.5) == "gemini-1.5-flash-001"
+        with pytest.raises(PolicyValidationError) as exc_info:
+            router.route_request("hr_dept", 0.5)
+        
+        assert "requer complexity_threshold" in str(exc_info.value)
@@ -3,6 +3,9 @@ Testes Unitários - CostEstimator
 """
 
 import pytest
+from pydantic import ValidationError
+
+from src.models import PricingModel
 from src.telemetry import CostEstimator
 
 
@@ -109,6 +112,25 @@ class TestCostEstimator:
         tokens = estimator._count_tokens("a")
         assert tokens >= 1
     
+    def test_chars_per_token_fallback_override(self):
+        """Testa que sobrescrever CHARS_PER_TOKEN_FALLBACK altera a aproximação."""
+        class WideEstimator(CostEstimator):
+            CHARS_PER_TOKEN_FALLBACK = 8
+        
+        assert CostEstimator()._chars_to_tokens(800) == 200
+        assert WideEstimator()._chars_to_tokens(800) == 100
+        
+        # Valores que não são inteiros potência de 2 usam divisão inteira
+        class NarrowEstimator(CostEstimator):
+            CHARS_PER_TOKEN_FALLBACK = 3
+        
+        class FloatEstimator(CostEstimator):
+            CHARS_PER_TOKEN_FALLBACK = 3.5
+        
+        assert NarrowEstimator()._chars_to_tokens(800) == 800 // 3
+        assert FloatEstimator()._chars_to_tokens(800) == int(800 // 3.5)
+        assert FloatEstimator()._chars_to_tokens(2) == 1
+    
     def test_cost_precision(self):
         """Testa que o custo retorna com precisão de 6 casas decimais."""
         estimator = CostEstimator()
@@ -146,3 +168,198 @@ class TestCostEstimator:
         # então a proporção pode não ser exata, mas deve ser maior
         assert cost_large >= cost_small * 3  # Pelo menos 3x maior
 
+    
+    def test_estimator_shares_policy_with_router(self):
+        """Testa que router e estimador compartilham uma única carga da política."""
+        from src.router import ModelRouter
+        
+        router = ModelRouter()
+        estimator = CostEstimator()
+        assert estimator.policy is router.policy
+        
+        # Política pré-carregada é usada diretamente, sem reler o arquivo
+        estimator = CostEstimator(policy_path="config/nonexistent.yaml", policy=router.policy)
+        assert estimator.policy is router.policy
+        assert estimator.pricing == router.policy.pricing
+    
+    def test_pricing_is_read_only(self):
+        """Testa que a política compartilhada não pode ser alterada via estimador."""
+        estimator = CostEstimator()
+        
+        with pytest.raises(TypeError):
+            estimator.pricing["gemini-1.5-pro-001"] = estimator.pricing["gemini-1.5-flash-001"]
+        with pytest.raises(TypeError):
+            estimator.policy.pricing["gemini-1.5-pro-001"] = PricingModel(
+                input_per_1k_tokens=99, output_per_1k_tokens=99
+            )
+        with pytest.raises(ValidationError):
+            estimator.policy.pricing = {}
+        
+        fresh = CostEstimator()
+        assert fresh.pricing["gemini-1.5-pro-001"].input_per_1k_tokens != 99
+        assert fresh.calculate_cost_tokens("gemini-1.5-pro-001", 1000, 0) == estimator.calculate_cost_tokens(
+            "gemini-1.5-pro-001", 1000, 0
+        )
+    
+    def test_calculate_cost_with_known_tokens(self):
+        """Testa cálculo com tokens já conhecidos (ex: usage_metadata da API)."""
+        estimator = CostEstimator()
+        
+        # Pro: 1000 tokens input * $0.00125/1k + 500 tokens output * $0.005/1k
+        cost = estimator.calculate_cost(
+            "gemini-1.5-pro-001",
+            input_tokens=1000,
+            output_tokens=500
+        )
+        
+        assert cost == pytest.approx(0.00375)
+    
+    def test_calculate_cost_from_text(self):
+        """Testa cálculo a partir dos textos reais do prompt e da resposta."""
+        estimator = CostEstimator()
+        
+        prompt = "Preciso revisar o contrato de parceria com a empresa XYZ"
+        response = '{"compliance_status": "REQUIRES_REVIEW"}'
+        cost = estimator.calculate_cost_from_text("gemini-1.5-pro-001", prompt, response)
+        expected = estimator.calculate_cost(
+            "gemini-1.5-pro-001",
+            input_tokens=estimator._count_tokens(prompt),
+            output_tokens=estimator._count_tokens(response)
+        )
+        
+        assert cost == expected
+        
+        with pytest.raises(KeyError):
+            estimator.calculate_cost_from_text("invalid-model", prompt, response)
+    
+    def test_count_tokens_memoized(self):
+        """Testa que textos repetidos reaproveitam a contagem de tokens."""
+        from src.telemetry import TIKTOKEN_AVAILABLE, _count_tokens_cached
+        
+        estimator = CostEstimator()
+        text = "Consultar saldo da conta corrente número 12345-6"
+        
+        first = estimator._count_tokens(text)
+        hits_before = _count_tokens_cached.cache_info().hits
+        second = estimator._count_tokens(text)
+        
+        assert first == second
+        if TIKTOKEN_AVAILABLE and estimator.token_encoder is not None:
+            assert _count_tokens_cached.cache_info().hits == hits_before + 1
+    
+    def test_count_tokens_batch_caps_threads(self):
+        """Testa que encode_batch não recebe mais threads que textos."""
+        estimator = CostEstimator()
+        
+        class RecordingEncoder:
+            def encode_batch(self, texts, num_threads):
+                self.num_threads = num_threads
+                return [[0] * len(text) for text in texts]
+        
+        estimator.token_encoder = RecordingEncoder()
+        assert estimator._count_tokens_batch(["ab", "c"]) == [2, 1]
+        assert 1 <= estimator.token_encoder.num_threads <= 2
+        
+        assert estimator._count_tokens_batch([]) == []
+        assert estimator.token_encoder.num_threads == 1
+    
+    def test_calculate_cost_batch(self):
+        """Testa cálculo em lote equivalente ao cálculo individual."""
+        estimator = CostEstimator()
+        
+        inputs = ["Consultar saldo", "Preciso transferir R$ 50.000 para a conta XYZ"]
+        outputs = ['{"risk_level": "LOW"}', '{"risk_level": "HIGH"}']
+        costs = estimator.calculate_cost_batch("gemini-1.5-pro-001", inputs, outputs)
+        
+        assert costs == [
+            estimator.calculate_cost_from_text("gemini-1.5-pro-001", i, o)
+            for i, o in zip(inputs, outputs)
+        ]
+        
+        with pytest.raises(ValueError):
+            estimator.calculate_cost_batch("gemini-1.5-pro-001", inputs, outputs[:1])
+        with pytest.raises(KeyError):
+            estimator.calculate_cost_batch("invalid-model", inputs, outputs)
+    
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_calculate_costs_mixed_models(self, use_numpy, monkeypatch):
+        """Testa cálculo em massa com modelos mistos (com e sem NumPy)."""
+        import src.telemetry as telemetry
+        if use_numpy and not telemetry.NUMPY_AVAILABLE:
+            pytest.skip("NumPy não instalado")
+        monkeypatch.setattr(telemetry, "NUMPY_AVAILABLE", use_numpy)
+        estimator = CostEstimator()
+        
+        models = ["gemini-1.5-pro-001", "gemini-1.5-flash-001", "gemini-1.5-pro-001"]
+        input_tokens = [1000, 1000, 250]
+        output_tokens = [500, 500, 0]
+        costs = estimator.calculate_costs(models, input_tokens, output_tokens)
+        
+        expected = [
+            estimator.calculate_cost(m, input_tokens=i, output_tokens=o)
+            for m, i, o in zip(models, input_tokens, output_tokens)
+        ]
+        assert costs == expected
+        assert estimator.calculate_costs([], [], []) == []
+        
+        with pytest.raises(KeyError):
+            estimator.calculate_costs(["invalid-model"], [1], [1])
+        with pytest.raises(ValueError):
+            estimator.calculate_costs(models, input_tokens, output_tokens[:1])
+    
+    def test_calculate_cost_tokens(self):
+        """Testa a função de custo especializada por modelo."""
+        estimator = CostEstimator()
+        
+        for model in ("gemini-1.5-pro-001", "gemini-1.5-flash-001"):
+            assert estimator.calculate_cost_tokens(model, 1000, 500) == estimator.calculate_cost(
+                model, input_tokens=1000, output_tokens=500
+            )
+        
+        with pytest.raises(KeyError):
+            estimator.calculate_cost_tokens("invalid-model", 1, 1)
+    
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_calculate_costs_by_id(self, use_numpy, monkeypatch):
+        """Testa cálculo em massa por id de modelo (arrays paralelos de preços)."""
+        import src.telemetry as telemetry
+        if use_numpy and not telemetry.NUMPY_AVAILABLE:
+            pytest.skip("NumPy não instalado")
+        monkeypatch.setattr(telemetry, "NUMPY_AVAILABLE", use_numpy)
+        estimator = CostEstimator()
+        
+        pro = estimator.model_id("gemini-1.5-pro-001")
+        flash = estimator.model_id("gemini-1.5-flash-001")
+        costs = estimator.calculate_costs_by_id([pro, flash, pro], [1000, 1000, 250], [500, 500, 0])
+        
+        assert costs == estimator.calculate_costs(
+            ["gemini-1.5-pro-001", "gemini-1.5-flash-001", "gemini-1.5-pro-001"],
+            [1000, 1000, 250],
+            [500, 500, 0]
+        )
+        
+        with pytest.raises(KeyError):
+            estimator.model_id("invalid-model")
+        with pytest.raises(ValueError):
+            estimator.calculate_costs_by_id([pro], [1, 2], [1])
+        for invalid_id in (-1, len(estimator.pricing)):
+            with pytest.raises(IndexError):
+                estimator.calculate_costs_by_id([invalid_id], [1000], [0])
+        for invalid_id in (0.9, True):
+            with pytest.raises(TypeError):
+                estimator.calculate_costs_by_id([invalid_id], [1000], [0])
+        assert estimator.calculate_costs_by_id([], [], []) == []
+    
+    def test_calculate_costs_from_chars(self):
+        """Testa cálculo em massa por caracteres equivalente ao calculate_cost."""
+        estimator = CostEstimator()
+        
+        models = ["gemini-1.5-pro-001", "gemini-1.5-flash-001"]
+        input_chars = [4000, 925]
+        output_chars = [2000, 3]
+        costs = estimator.calculate_costs_from_chars(models, input_chars, output_chars)
+        
+        assert costs == [
+            estimator.calculate_cost(m, i, o)
+            for m, i, o in zip(models, input_chars, output_chars)
+        ]